@@ -4,6 +4,7 @@ Article caching module with TTL (Time-To-Live) support.
 Caches fetched articles to avoid redundant API calls within a time window.
 """
 
+import hashlib
 import json
 import logging
 import time
@@ -148,8 +149,12 @@ class ArticleCache:
             return 0
 
 
-# Global cache instance
+# Global cache instances
 _cache: Optional[ArticleCache] = None
+_ai_cache: Optional[ArticleCache] = None
+
+# AI results depend only on the article text and prompt, so they can live much longer
+AI_CACHE_TTL_SECONDS = 7 * 24 * 3600
 
 
 def get_cache(ttl_seconds: int = 1800) -> ArticleCache:
@@ -192,3 +197,37 @@ def get_cached_articles(cache_key: str = "articles") -> Optional[List]:
     if cached_data:
         return cached_data.get('articles', [])
     return None
+
+
+def get_ai_cache() -> ArticleCache:
+    """Get or create the cache for Gemini results (summaries, sentiments)."""
+    global _ai_cache
+    if _ai_cache is None:
+        cache_dir = Path(__file__).parent.parent / "output" / "cache" / "ai"
+        _ai_cache = ArticleCache(cache_dir=cache_dir, ttl_seconds=AI_CACHE_TTL_SECONDS)
+    return _ai_cache
+
+
+def ai_cache_key(kind: str, *parts: str) -> str:
+    """
+    Build a cache key from everything that determines an AI result.
+
+    Args:
+        kind: Result type prefix (e.g. "summary", "sentiment")
+        parts: Model name, prompt template, article text, ...
+
+    Returns:
+        Filename-safe key; identical inputs always map to the same key
+    """
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode('utf-8')).hexdigest()
+    return f"{kind}_{digest}"
+
+
+def get_cached_ai_result(key: str) -> Optional[dict]:
+    """Get a cached AI result or None."""
+    return get_ai_cache().get(key)
+
+
+def cache_ai_result(key: str, result: dict) -> bool:
+    """Cache an AI result."""
+    return get_ai_cache().set(key, result)
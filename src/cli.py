@@ -22,7 +22,11 @@ from config.loader import load_config, ConfigError
 from sources.rss_fetcher import fetch_all_articles
 from processors.scorer import score_articles, get_top_articles
 from processors.summarizer import summarize_articles
-from formatters.email_formatter import format_newsletter_html, save_newsletter
+from formatters.email_formatter import iter_newsletter_html, save_newsletter
+
+# Summary length shown in the review file before truncating
+_REVIEW_SUMMARY_LEN = 200
+_ELLIPSIS = "..."
 
 
 def get_output_dir() -> Path:
@@ -92,7 +96,7 @@ def cmd_scout(args):
                 "url": a.url,
                 "source": a.source,
                 "score": a.score,
-                "summary": a.summary[:200] + "..." if len(a.summary) > 200 else a.summary,
+                "summary": a.summary[:_REVIEW_SUMMARY_LEN].rstrip() + _ELLIPSIS if len(a.summary) > _REVIEW_SUMMARY_LEN else a.summary,
                 "published": a.published.isoformat() if a.published else None,
                 "selected": False
             }
@@ -275,7 +279,7 @@ def cmd_compose(args):
     
     # Generate HTML
     print("\n📝 Formatting newsletter...")
-    html = format_newsletter_html(articles, config)
+    html = iter_newsletter_html(articles, config)
     
     # Save
     output_file = save_newsletter(html, output_dir)
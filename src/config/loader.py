@@ -4,13 +4,18 @@ Configuration management with Pydantic validation.
 Centralizes config loading and validation across all modules.
 """
 
+import copy
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 import yaml
 from pydantic import BaseModel, Field, validator, ValidationError
 
+# Use libyaml's C loader when available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 # Configuration Models using Pydantic
 class NewsletterConfig(BaseModel):
@@ -76,6 +81,8 @@ class GeminiConfig(BaseModel):
     summary_style: str = "analytical"
     include_commentary: bool = True
     max_summary_length: int = 150
+    max_concurrent: int = Field(3, ge=1)  # Parallel summarization requests
+    batch_size: int = Field(4, ge=1)  # Articles per sentiment classification request
 
     @validator('summary_style')
     def validate_style(cls, v):
@@ -141,12 +148,21 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
 
     config_path = Path(config_path)
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise ConfigError(f"Config file not found: {config_path}")
 
+    # Parsed config is cached per file version; hand each caller its own copy to mutate
+    return copy.deepcopy(_load_config_cached(str(config_path), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse and validate a config file; cache key includes mtime and size."""
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ConfigError(f"Failed to parse YAML: {e}")
     except Exception as e:
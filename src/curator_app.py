@@ -11,13 +11,17 @@ Usage:
 Opens browser to http://127.0.0.1:5000
 """
 
+import heapq
 import json
 import logging
 import os
+import uuid
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from threading import Timer
+from threading import Lock, Timer
 
 # Load environment variables from .env file
 try:
@@ -32,6 +36,9 @@ from functools import wraps
 # Import Kanban template
 from src.templates.kanban_template import KANBAN_TEMPLATE
 
+# Import Gemini response parser
+from src.processors.response_parser import parse_json_response
+
 # Import rate limiter for AI endpoints
 from src.rate_limiter import rate_limit
 
@@ -45,6 +52,29 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', os.urandom(24).hex())
 
+# gzip/brotli responses when flask-compress is installed
+try:
+    from flask_compress import Compress
+    Compress(app)
+except ImportError:
+    logger.debug("flask-compress not installed, responses will not be compressed")
+
+# Cache-Control per route; everything else keeps Flask's defaults
+CACHE_CONTROL = {
+    '/': 'no-store',
+    '/preview': 'no-cache',
+    '/scores': 'private, max-age=60',
+}
+
+
+@app.after_request
+def set_cache_headers(response):
+    """Apply CACHE_CONTROL to successful responses."""
+    cache_control = CACHE_CONTROL.get(request.path)
+    if cache_control and response.status_code == 200:
+        response.headers['Cache-Control'] = cache_control
+    return response
+
 # Password protection - set AUTH_PASSWORD env var for cloud deployment
 AUTH_PASSWORD = os.environ.get('AUTH_PASSWORD', '')
 
@@ -94,6 +124,13 @@ SECTIONS = [
 assignments = {s["id"]: [] for s in SECTIONS}
 theme_of_week = {"title": "", "content": "", "enabled": False}
 
+# Background newsletter generation (job_id -> status dict). A single worker keeps
+# jobs from racing on curated_report.json and the newsletter output file.
+_executor = ThreadPoolExecutor(max_workers=1)
+_generate_jobs = OrderedDict()
+_generate_jobs_lock = Lock()  # request threads and the worker both update _generate_jobs
+MAX_GENERATE_JOBS = 50
+
 
 # Canadian keywords for detection
 CANADIAN_KEYWORDS = [
@@ -104,6 +141,13 @@ CANADIAN_KEYWORDS = [
 ]
 
 
+# Title terms that mark an article as worth spending a Gemini score on
+HIGH_SIGNAL_TERMS = [
+    'government', 'governance', 'regulation', 'policy', 'legislation',
+    'bill c-27', 'aida', 'public sector', 'responsible ai', 'ethics', 'safety'
+]
+
+
 def is_canadian_content(article: dict) -> bool:
     """Check if article contains Canadian content."""
     text = ' '.join([
@@ -167,11 +211,42 @@ def save_article_scores():
         json.dump(_article_scores, f, indent=2)
 
 
+def prescore_article(article: dict, now: datetime) -> float:
+    """
+    Cheap keyword/recency prior used to pick which articles go to Gemini.
+    
+    Priority order: Canadian > Governance > high-signal title terms > Recent
+    """
+    score = 0.0
+    if article.get('_is_canadian'):
+        score += 1000
+    category = article.get('category', '').lower()
+    source = article.get('source', '').lower()
+    if 'governance' in category or 'governance' in source:
+        score += 500
+    if 'canada' in source:
+        score += 300
+    
+    title = article.get('title', '').lower()
+    score += 50 * sum(1 for term in HIGH_SIGNAL_TERMS if term in title)
+    
+    # Newer is better: up to +70 for articles from the last week
+    try:
+        published = datetime.fromisoformat(article.get('published', ''))
+        # Feed timestamps usually carry an offset; compare as naive like scout does
+        days_old = (now - published.replace(tzinfo=None)).days
+    except (TypeError, ValueError):
+        days_old = 7
+    score += 10 * max(0, 7 - days_old)
+    return score
+
+
 def score_articles_with_ai(articles: list, max_to_score: int = 100) -> dict:
     """
     Score articles using Gemini AI. Only scores the top priority articles.
     
-    Priority order: Canadian > Governance > Recent
+    Articles with cached scores are returned as-is; the rest are ranked by
+    prescore_article() and only the best max_to_score are sent to Gemini.
     """
     import os
     try:
@@ -187,26 +262,22 @@ def score_articles_with_ai(articles: list, max_to_score: int = 100) -> dict:
     
     genai.configure(api_key=api_key)
     
-    # Sort articles by priority: Canadian first, then governance, then recent
-    def priority_sort(a):
-        score = 0
-        if a.get('_is_canadian'):
-            score += 1000
-        category = a.get('category', '').lower()
-        source = a.get('source', '').lower()
-        if 'governance' in category or 'governance' in source:
-            score += 500
-        if 'canada' in source:
-            score += 300
-        # More recent is better (use published date)
-        return score
+    # Reuse cached scores; only unscored articles compete for the Gemini budget
+    scores = {}
+    candidates = []
+    for article in articles:
+        key = str(article.get('_index'))
+        if key in _article_scores:
+            scores[key] = _article_scores[key]
+        else:
+            candidates.append(article)
     
-    sorted_articles = sorted(articles, key=priority_sort, reverse=True)
-    to_score = sorted_articles[:max_to_score]
+    # Forward the best candidates by cheap prior, not just the first ones
+    now = datetime.now()
+    to_score = heapq.nlargest(max_to_score, candidates, key=lambda a: prescore_article(a, now))
     
     logger.info(f"🤖 AI Scoring {len(to_score)} priority articles...")
     
-    scores = {}
     model = genai.GenerativeModel('models/gemini-2.0-flash')
     
     for i, article in enumerate(to_score):
@@ -215,11 +286,6 @@ def score_articles_with_ai(articles: list, max_to_score: int = 100) -> dict:
         summary = article.get('summary', '')[:300]
         source = article.get('source', '')
         
-        # Skip if already scored
-        if str(idx) in _article_scores:
-            scores[str(idx)] = _article_scores[str(idx)]
-            continue
-        
         prompt = f"""You are scoring articles for "AI This Week" - a Canadian government newsletter.
 
 Article: {title}
@@ -244,15 +310,7 @@ Sections: headlines, bright_spots, tools, deep_dives, grain_quality, learning"""
 
         try:
             response = model.generate_content(prompt)
-            text = response.text.strip()
-            
-            # Clean JSON
-            if text.startswith('```'):
-                text = text.split('```')[1]
-                if text.startswith('json'):
-                    text = text[4:]
-            
-            result = json.loads(text)
+            result = parse_json_response(response.text)
             scores[str(idx)] = {
                 'score': int(result.get('score', 5)),
                 'section': result.get('section', 'headlines'),
@@ -274,15 +332,20 @@ Sections: headlines, bright_spots, tools, deep_dives, grain_quality, learning"""
     return scores
 
 
-def save_curated_report():
+def save_curated_report(section_assignments: dict = None, theme: dict = None):
     """Save current assignments to curated_report.json"""
+    if section_assignments is None:
+        section_assignments = assignments
+    if theme is None:
+        theme = theme_of_week
+
     articles = load_raw_intel()
     
     report = {}
     for section in SECTIONS:
         section_id = section["id"]
         section_articles = []
-        for idx in assignments.get(section_id, []):
+        for idx in section_assignments.get(section_id, []):
             if 0 <= idx < len(articles):
                 article = articles[idx]
                 section_articles.append({
@@ -294,7 +357,7 @@ def save_curated_report():
         report[section_id] = section_articles
     
     # Add theme of week
-    report["theme_of_week"] = theme_of_week
+    report["theme_of_week"] = theme
     
     output_path = DATA_DIR / "curated_report.json"
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -1408,13 +1471,7 @@ Respond in JSON:
         model = genai.GenerativeModel('models/gemini-2.0-flash')
         response = model.generate_content(prompt)
         
-        text = response.text.strip()
-        if text.startswith('```'):
-            text = text.split('```')[1]
-            if text.startswith('json'):
-                text = text[4:]
-        
-        result = json.loads(text)
+        result = parse_json_response(response.text)
         return jsonify({"success": True, "title": result.get('title', ''), "content": result.get('content', '')})
         
     except Exception as e:
@@ -1430,28 +1487,64 @@ def get_scores():
     return jsonify(scores)
 
 
+def _do_generate(section_assignments: dict, theme: dict) -> str:
+    """Write the curated report and render the email HTML (runs on _executor)."""
+    save_curated_report(section_assignments, theme)
+    output_path, _ = generate_email_html()
+    return str(output_path)
+
+
+def _on_generate_done(job_id: str, future) -> None:
+    """Record the outcome of a background generate job (unless it was already evicted)."""
+    try:
+        result = {"status": "done", "path": future.result()}
+    except Exception as e:
+        logger.error(f"Generate error: {e}")
+        result = {"status": "error", "error": str(e)}
+    with _generate_jobs_lock:
+        if job_id in _generate_jobs:
+            _generate_jobs[job_id] = result
+
+
 @app.route('/generate', methods=['POST'])
 @requires_auth
 def generate():
-    """Generate newsletter from assignments"""
+    """Queue newsletter generation from assignments"""
     global assignments, theme_of_week
     try:
         data = request.get_json()
         assignments = data.get('assignments', {})
         theme_of_week = data.get('theme', {"title": "", "content": "", "enabled": False})
         
-        # Save curated report
-        save_curated_report()
+        # Save report and render HTML off the request thread
+        job_id = uuid.uuid4().hex
+        with _generate_jobs_lock:
+            _generate_jobs[job_id] = {"status": "pending"}
+            # Drop the oldest jobs nobody polled for
+            while len(_generate_jobs) > MAX_GENERATE_JOBS:
+                _generate_jobs.popitem(last=False)
+        future = _executor.submit(_do_generate, assignments, theme_of_week)
+        future.add_done_callback(lambda f: _on_generate_done(job_id, f))
         
-        # Generate email HTML
-        output_path, _ = generate_email_html()
-        
-        return jsonify({"success": True, "path": str(output_path)})
+        return jsonify({"success": True, "job_id": job_id})
     except Exception as e:
         logger.error(f"Generate error: {e}")
         return jsonify({"success": False, "error": str(e)})
 
 
+@app.route('/generate/status/<job_id>')
+@requires_auth
+def generate_status(job_id):
+    """Poll the status of a queued generate job (finished jobs are forgotten once read)"""
+    with _generate_jobs_lock:
+        job = _generate_jobs.get(job_id)
+        if job is not None and job["status"] != "pending":
+            del _generate_jobs[job_id]
+    if job is None:
+        return jsonify({"success": False, "error": "Unknown job"}), 404
+    return jsonify({"success": job["status"] != "error", **job})
+
+
 @app.route('/preview')
 @requires_auth
 def preview():
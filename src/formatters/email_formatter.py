@@ -6,28 +6,82 @@ Generates Outlook-compatible HTML emails matching the "AI This Week" style.
 Uses a table-based layout for proper rendering in Outlook.
 """
 
-from typing import List
-from datetime import datetime
+import os
+import re
+from collections import defaultdict
+from html import escape as _esc
+from typing import Iterable, Iterator, List, Union
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 
-# Import from parent
+# Import from parent (modules here are imported both as `formatters.*` and
+# `src.formatters.*`, so a relative import past the package is not possible)
 import sys
-sys.path.append(str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 from sources.rss_fetcher import Article
 
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+
+
+# Display order of category blocks in format_newsletter_html
+_CATEGORY_ORDER = ('governance', 'capabilities', 'business', 'education', 'tools', 'research', 'uncategorized')
+
+
+_CATEGORY_EMOJIS = {
+    'governance': '⚖️',
+    'capabilities': '🚀',
+    'business': '💼',
+    'education': '📚',
+    'tools': '🛠️',
+    'research': '🔬',
+    'uncategorized': '📰'
+}
+_DEFAULT_EMOJI = '📰'
+
 
 def get_category_emoji(category: str) -> str:
     """Get emoji for article category."""
-    emojis = {
-        'governance': '⚖️',
-        'capabilities': '🚀',
-        'business': '💼',
-        'education': '📚',
-        'tools': '🛠️',
-        'research': '🔬',
-        'uncategorized': '📰'
-    }
-    return emojis.get(category.lower(), '📰')
+    # Categories are normally lowercase already; only fold case on a miss
+    return _CATEGORY_EMOJIS.get(category) or _CATEGORY_EMOJIS.get(category.lower(), _DEFAULT_EMOJI)
+
+
+# Category header text, rendered once at import
+_CATEGORY_LABELS = {cat: f"{get_category_emoji(cat)} {cat.title()}" for cat in _CATEGORY_ORDER}
+
+
+class _LazyBytecodeCache(FileSystemBytecodeCache):
+    """Persist compiled templates across runs, creating the cache dir only on first write."""
+
+    def dump_bytecode(self, bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            # Unwritable output dir: templates are simply recompiled next run
+            pass
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache:
+    """Bytecode cache under output/cache/jinja, next to the article cache."""
+    return _LazyBytecodeCache(str(Path(__file__).parent.parent.parent / 'output' / 'cache' / 'jinja'))
+
+
+# Shared environment for all newsletter templates
+_env = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / 'templates'),
+    autoescape=select_autoescape(['html']),
+    bytecode_cache=_bytecode_cache(),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+_NEWSLETTER_TMPL = _env.get_template('newsletter.html')
+_SECTIONS_TMPL = _env.get_template('newsletter_sections.html')
+_SECTION_TMPL = _env.get_template('article_section.html')
 
 
 def format_date(dt: datetime) -> str:
@@ -37,6 +91,48 @@ def format_date(dt: datetime) -> str:
     return dt.strftime("%B %d, %Y")
 
 
+@lru_cache(maxsize=2)
+def _week_of(ordinal: int) -> str:
+    """Display date for a proleptic Gregorian ordinal, formatted once per day."""
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+def iter_newsletter_html(articles: List[Article], config: dict,
+                         tool_of_week: dict = None,
+                         learning_items: List[dict] = None,
+                         deep_dive: dict = None,
+                         theme_of_week: dict = None) -> Iterator[str]:
+    """
+    Stream newsletter HTML in chunks as the template renders.
+
+    Takes the same arguments as format_newsletter_html. Useful for writing
+    straight to a file without holding the whole document in memory.
+    """
+    newsletter_config = config.get('newsletter', {})
+    week_of = _week_of(date.today().toordinal())
+    
+    # Group articles by category
+    categories = defaultdict(list)
+    for article in articles:
+        categories[article.category or "uncategorized"].append(article)
+    
+    categories_ordered = []
+    for cat in _CATEGORY_ORDER:
+        cat_articles = categories.get(cat)
+        if cat_articles:
+            categories_ordered.append((_CATEGORY_LABELS[cat], cat_articles))
+    
+    return _NEWSLETTER_TMPL.generate(
+        newsletter_name=newsletter_config.get('name', 'AI This Week'),
+        tagline=newsletter_config.get('tagline', 'Key AI Developments You Should Know'),
+        week_of=week_of,
+        categories_ordered=categories_ordered,
+        tool_of_week=tool_of_week,
+        learning_items=learning_items,
+        theme_of_week=theme_of_week,
+    )
+
+
 def format_newsletter_html(articles: List[Article], config: dict, 
                            tool_of_week: dict = None,
                            learning_items: List[dict] = None,
@@ -48,226 +144,20 @@ def format_newsletter_html(articles: List[Article], config: dict,
     Uses table-based layout with category headers, similar to the user's
     original newsletter format.
     """
-    newsletter_config = config.get('newsletter', {})
-    newsletter_name = newsletter_config.get('name', 'AI This Week')
-    tagline = newsletter_config.get('tagline', 'Key AI Developments You Should Know')
-    
-    today = datetime.now()
-    week_of = format_date(today)
-    
-    # Group articles by category
-    categories = {}
-    for article in articles:
-        cat = article.category or "uncategorized"
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(article)
-    
-    # Build articles HTML - organized by category
-    articles_html = ""
-    
-    for cat in ['governance', 'capabilities', 'business', 'education', 'tools', 'research', 'uncategorized']:
-        if cat not in categories:
-            continue
-            
-        cat_articles = categories[cat]
-        emoji = get_category_emoji(cat)
-        
-        # Category header
-        articles_html += f'''
-        <tr>
-            <td style="padding: 20px 30px 10px 30px; background-color: #f8f9fa; border-top: 3px solid #1a1a2e;">
-                <h3 style="color: #1a1a2e; margin: 0; font-size: 16px; text-transform: uppercase; letter-spacing: 1px;">
-                    {emoji} {cat.title()}
-                </h3>
-            </td>
-        </tr>
-        '''
-        
-        # Articles in this category
-        for article in cat_articles:
-            summary = article.ai_summary if article.ai_summary else article.summary
-            commentary = article.ai_commentary if hasattr(article, 'ai_commentary') else ""
-            
-            # Don't truncate - show full AI-generated summary
-            
-            articles_html += f'''
-        <tr>
-            <td style="padding: 15px 30px; border-bottom: 1px solid #eee;">
-                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                    <tr>
-                        <td valign="top" width="100%">
-                            <a href="{article.url}" style="color: #1a1a2e; text-decoration: none; font-size: 16px; font-weight: 600; line-height: 1.4; display: block; margin-bottom: 8px;">{article.title}</a>
-                            <p style="color: #444444; margin: 0 0 8px 0; font-size: 14px; line-height: 1.6;">{summary}</p>
-                            {f'<p style="color: #666666; margin: 0 0 8px 0; font-size: 13px; line-height: 1.5; font-style: italic; border-left: 2px solid #667eea; padding-left: 10px;">💡 {commentary}</p>' if commentary else ''}
-                            <p style="margin: 0;">
-                                <span style="color: #888888; font-size: 12px;">{article.source}</span>
-                                <span style="color: #cccccc;"> | </span>
-                                <a href="{article.url}" style="color: #667eea; text-decoration: none; font-size: 12px; font-weight: 500;">Read more →</a>
-                            </p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-            '''
-    
-    # Tool of the Week section
-    tool_html = ""
-    if tool_of_week:
-        tool_html = f'''
-        <tr>
-            <td style="padding: 25px 30px; background-color: #1a1a2e;">
-                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                    <tr>
-                        <td>
-                            <h2 style="color: #ffffff; margin: 0 0 15px 0; font-size: 16px; text-transform: uppercase; letter-spacing: 1px;">🛠️ Tool of the Week</h2>
-                            <h3 style="color: #667eea; margin: 0 0 10px 0; font-size: 18px;">{tool_of_week.get('name', '')}</h3>
-                            <p style="color: #cccccc; margin: 0 0 15px 0; font-size: 14px; line-height: 1.5;">{tool_of_week.get('description', '')}</p>
-                            <a href="{tool_of_week.get('url', '#')}" style="display: inline-block; background-color: #667eea; color: white; padding: 8px 20px; border-radius: 4px; text-decoration: none; font-size: 13px; font-weight: 500;">Try it →</a>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-        '''
-    
-    # Learning section
-    learning_html = ""
-    if learning_items:
-        items = "".join([
-            f'<tr><td style="padding: 8px 0;"><span style="color: #667eea; font-weight: bold;">▸</span> {item.get("title", "")} — <a href="{item.get("url", "#")}" style="color: #667eea; text-decoration: none;">{item.get("type", "Link")}</a></td></tr>' 
-            for item in learning_items
-        ])
-        learning_html = f'''
-        <tr>
-            <td style="padding: 25px 30px; background-color: #f8f9fa;">
-                <h2 style="color: #1a1a2e; margin: 0 0 15px 0; font-size: 16px; text-transform: uppercase; letter-spacing: 1px;">📚 Learning</h2>
-                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0" style="font-size: 14px; color: #444;">
-                    {items}
-                </table>
-            </td>
-        </tr>
-        '''
-    
-    # Theme of the Week section
-    theme_html = ""
-    if theme_of_week and theme_of_week.get('enabled') and theme_of_week.get('content'):
-        theme_html = f'''
-        <tr>
-            <td style="padding: 0;">
-                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                    <tr>
-                        <td style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 25px 30px;">
-                            <h2 style="color: #ffffff; margin: 0 0 5px 0; font-size: 12px; text-transform: uppercase; letter-spacing: 2px; opacity: 0.8;">💡 Theme of the Week</h2>
-                            <h3 style="color: #ffffff; margin: 0 0 15px 0; font-size: 20px; font-weight: 600; line-height: 1.3;">{theme_of_week.get('title', '')}</h3>
-                            <p style="color: #e8e8ff; margin: 0; font-size: 15px; line-height: 1.7; font-style: italic;">{theme_of_week.get('content', '')}</p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-        '''
-    
-    # Complete HTML
-    html = f'''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{newsletter_name} - {week_of}</title>
-    <!--[if mso]>
-    <style type="text/css">
-        body, table, td {{font-family: Arial, Helvetica, sans-serif !important;}}
-        .article-title {{font-size: 16px !important;}}
-    </style>
-    <![endif]-->
-    <style>
-        @media only screen and (max-width: 600px) {{
-            .container {{ width: 100% !important; }}
-        }}
-    </style>
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f4f4f4; -webkit-font-smoothing: antialiased;">
-    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-        <tr>
-            <td align="center" style="padding: 20px 10px;">
-                <table role="presentation" class="container" width="650" cellspacing="0" cellpadding="0" border="0" style="background-color: #ffffff; border-radius: 8px; overflow: hidden; box-shadow: 0 4px 12px rgba(0,0,0,0.1);">
-                    
-                    <!-- Header -->
-                    <tr>
-                        <td style="background-color: #1a1a2e; padding: 35px 30px; text-align: center;">
-                            <h1 style="color: #ffffff; margin: 0; font-size: 28px; font-weight: 700; letter-spacing: -0.5px;">
-                                🤖 {newsletter_name}
-                            </h1>
-                            <p style="color: #a0a0a0; margin: 10px 0 0 0; font-size: 14px; font-weight: 400;">{tagline}</p>
-                        </td>
-                    </tr>
-                    
-                    <!-- Intro -->
-                    <tr>
-                        <td style="padding: 25px 30px; border-bottom: 1px solid #eee;">
-                            <p style="color: #444444; margin: 0; font-size: 15px; line-height: 1.6;">
-                                <strong>Hello,</strong>
-                            </p>
-                            <p style="color: #444444; margin: 10px 0 0 0; font-size: 15px; line-height: 1.6;">
-                                Here are this week's key AI developments you should know about.
-                            </p>
-                            <p style="color: #888888; margin: 10px 0 0 0; font-size: 13px;">
-                                📅 Week of {week_of}
-                            </p>
-                        </td>
-                    </tr>
-                    
-                    <!-- Section Header -->
-                    <tr>
-                        <td style="padding: 20px 30px 10px 30px;">
-                            <h2 style="color: #1a1a2e; margin: 0; font-size: 18px; font-weight: 700;">
-                                📰 Key Developments
-                            </h2>
-                        </td>
-                    </tr>
-                    
-                    <!-- Articles by Category -->
-                    {articles_html}
-                    
-                    <!-- Tool of the Week -->
-                    {tool_html}
-                    
-                    <!-- Theme of the Week -->
-                    {theme_html}
-                    
-                    <!-- Learning -->
-                    {learning_html}
-                    
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color: #1a1a2e; padding: 25px 30px; text-align: center;">
-                            <p style="color: #888888; margin: 0 0 5px 0; font-size: 12px;">
-                                Curated with 🤖 by AI Newsletter Bot
-                            </p>
-                            <p style="color: #666666; margin: 0; font-size: 11px;">
-                                {today.strftime("%B %d, %Y")}
-                            </p>
-                        </td>
-                    </tr>
-                    
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>'''
-    
-    return html
+    return ''.join(iter_newsletter_html(articles, config, tool_of_week,
+                                        learning_items, deep_dive, theme_of_week))
+
 
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
 
-def format_paragraphs(text: str) -> str:
+
+def format_paragraphs(text: str, color: str = '#444444') -> str:
     """
     Convert multi-paragraph text (with \\n\\n separators) to HTML <p> tags.
 
     Args:
         text: Text with paragraphs separated by double newlines
+        color: CSS text color for the paragraphs
 
     Returns:
         HTML with <p> tags for each paragraph
@@ -275,100 +165,35 @@ def format_paragraphs(text: str) -> str:
     if not text:
         return ""
 
-    # Split on double newlines
-    paragraphs = text.split('\n\n')
-    html_paragraphs = []
-
-    for para in paragraphs:
-        para = para.strip()
-        if para:  # Only add non-empty paragraphs
-            html_paragraphs.append(f'<p style="color: #444444; margin: 0 0 12px 0; font-size: 14px; line-height: 1.6;">{para}</p>')
-
-    return ''.join(html_paragraphs)
+    # Split on blank lines (which may contain stray whitespace), skip empty paragraphs
+    open_tag = f'<p style="color: {color}; margin: 0 0 12px 0; font-size: 14px; line-height: 1.6;">'
+    return ''.join([
+        f'{open_tag}{_esc(para)}</p>'
+        for para in map(str.strip, _PARAGRAPH_SPLIT.split(text))
+        if para
+    ])
 
 
-def build_headline_section(articles: List[Article]) -> str:
-    """Build Headline Summary section with 2-3 paragraph summaries."""
+def _section(articles: List[Article], title: str, emoji: str,
+             show_source: bool = True, bullet: str = '') -> str:
+    """Render a titled list of articles with their multi-paragraph summaries."""
     if not articles:
         return ""
 
-    headlines_html = f'''
-    <tr>
-        <td style="padding: 20px 30px 10px 30px;">
-            <h2 style="color: #1a1a2e; margin: 0; font-size: 18px; font-weight: 700;">
-                📰 HEADLINE SUMMARY
-            </h2>
-        </td>
-    </tr>
-    '''
+    rows = [(article, format_paragraphs(article.ai_summary or article.summary))
+            for article in articles]
+    return _SECTION_TMPL.render(rows=rows, title=title, emoji=emoji,
+                                show_source=show_source, bullet=bullet)
 
-    for article in articles:
-        summary = article.ai_summary if article.ai_summary else article.summary
 
-        headlines_html += f'''
-    <tr>
-        <td style="padding: 15px 30px; border-bottom: 1px solid #eee;">
-            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                <tr>
-                    <td valign="top" width="100%">
-                        <h3 style="color: #1a1a2e; margin: 0 0 10px 0; font-size: 15px; font-weight: 600; line-height: 1.4;">
-                            🔹 <a href="{article.url}" style="color: #1a1a2e; text-decoration: none;">{article.title}</a>
-                        </h3>
-                        {format_paragraphs(summary)}
-                        <p style="margin: 0; margin-top: 8px;">
-                            <span style="color: #888888; font-size: 12px;">{article.source}</span>
-                            <span style="color: #cccccc;"> | </span>
-                            <a href="{article.url}" style="color: #667eea; text-decoration: none; font-size: 12px; font-weight: 500;">Read more →</a>
-                        </p>
-                    </td>
-                </tr>
-            </table>
-        </td>
-    </tr>
-    '''
-
-    return headlines_html
+def build_headline_section(articles: List[Article]) -> str:
+    """Build Headline Summary section with 2-3 paragraph summaries."""
+    return _section(articles, 'HEADLINE SUMMARY', '📰', bullet='🔹 ')
 
 
 def build_bright_spot_section(articles: List[Article]) -> str:
     """Build Bright Spot of the Week section."""
-    if not articles:
-        return ""
-
-    bright_html = f'''
-    <tr>
-        <td style="padding: 20px 30px 10px 30px;">
-            <h2 style="color: #1a1a2e; margin: 0; font-size: 18px; font-weight: 700;">
-                ✨ BRIGHT SPOT OF THE WEEK
-            </h2>
-        </td>
-    </tr>
-    '''
-
-    for article in articles:
-        summary = article.ai_summary if article.ai_summary else article.summary
-
-        bright_html += f'''
-    <tr>
-        <td style="padding: 15px 30px; border-bottom: 1px solid #eee;">
-            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                <tr>
-                    <td valign="top" width="100%">
-                        <h3 style="color: #1a1a2e; margin: 0 0 10px 0; font-size: 15px; font-weight: 600; line-height: 1.4;">
-                            <a href="{article.url}" style="color: #1a1a2e; text-decoration: none;">{article.title}</a>
-                        </h3>
-                        {format_paragraphs(summary)}
-                        <p style="margin: 0; margin-top: 8px;">
-                            <a href="{article.url}" style="color: #667eea; text-decoration: none; font-size: 12px; font-weight: 500;">Read more →</a>
-                        </p>
-                    </td>
-                </tr>
-            </table>
-        </td>
-    </tr>
-    '''
-
-    return bright_html
+    return _section(articles, 'BRIGHT SPOT OF THE WEEK', '✨', show_source=False)
 
 
 def build_tool_section(articles: List[Article]) -> str:
@@ -378,6 +203,7 @@ def build_tool_section(articles: List[Article]) -> str:
 
     article = articles[0]  # Only show first tool
     summary = article.ai_summary if article.ai_summary else article.summary
+    title, url = _esc(article.title), _esc(article.url)
 
     tool_html = f'''
     <tr>
@@ -387,12 +213,12 @@ def build_tool_section(articles: List[Article]) -> str:
                     <td>
                         <h2 style="color: #ffffff; margin: 0 0 15px 0; font-size: 16px; text-transform: uppercase; letter-spacing: 1px;">🛠️ TOOL OF THE WEEK</h2>
                         <h3 style="color: #667eea; margin: 0 0 10px 0; font-size: 16px;">
-                            <a href="{article.url}" style="color: #667eea; text-decoration: none;">{article.title}</a>
+                            <a href="{url}" style="color: #667eea; text-decoration: none;">{title}</a>
                         </h3>
                         <div style="color: #cccccc; margin: 0 0 15px 0; font-size: 14px; line-height: 1.5;">
-                            {format_paragraphs(summary).replace('color: #444444', 'color: #cccccc')}
+                            {format_paragraphs(summary, color='#cccccc')}
                         </div>
-                        <a href="{article.url}" style="display: inline-block; background-color: #667eea; color: white; padding: 8px 20px; border-radius: 4px; text-decoration: none; font-size: 13px; font-weight: 500;">Try it →</a>
+                        <a href="{url}" style="display: inline-block; background-color: #667eea; color: white; padding: 8px 20px; border-radius: 4px; text-decoration: none; font-size: 13px; font-weight: 500;">Try it →</a>
                     </td>
                 </tr>
             </table>
@@ -420,86 +246,12 @@ def build_learning_section() -> str:
 
 def build_deep_dive_section(articles: List[Article]) -> str:
     """Build Deep Dive section with 3-4 paragraph analysis pieces."""
-    if not articles:
-        return ""
-
-    deep_html = f'''
-    <tr>
-        <td style="padding: 20px 30px 10px 30px;">
-            <h2 style="color: #1a1a2e; margin: 0; font-size: 18px; font-weight: 700;">
-                📊 DEEP DIVE
-            </h2>
-        </td>
-    </tr>
-    '''
-
-    for article in articles:
-        summary = article.ai_summary if article.ai_summary else article.summary
-
-        deep_html += f'''
-    <tr>
-        <td style="padding: 15px 30px; border-bottom: 1px solid #eee;">
-            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                <tr>
-                    <td valign="top" width="100%">
-                        <h3 style="color: #1a1a2e; margin: 0 0 10px 0; font-size: 15px; font-weight: 600; line-height: 1.4;">
-                            <a href="{article.url}" style="color: #1a1a2e; text-decoration: none;">{article.title}</a>
-                        </h3>
-                        {format_paragraphs(summary)}
-                        <p style="margin: 0; margin-top: 8px;">
-                            <span style="color: #888888; font-size: 12px;">{article.source}</span>
-                            <span style="color: #cccccc;"> | </span>
-                            <a href="{article.url}" style="color: #667eea; text-decoration: none; font-size: 12px; font-weight: 500;">Read more →</a>
-                        </p>
-                    </td>
-                </tr>
-            </table>
-        </td>
-    </tr>
-    '''
-
-    return deep_html
+    return _section(articles, 'DEEP DIVE', '📊')
 
 
 def build_grain_quality_section(articles: List[Article]) -> str:
     """Build optional Grain Quality section for agriculture/farming AI."""
-    if not articles:
-        return ""
-
-    grain_html = f'''
-    <tr>
-        <td style="padding: 20px 30px 10px 30px;">
-            <h2 style="color: #1a1a2e; margin: 0; font-size: 18px; font-weight: 700;">
-                🌾 GRAIN QUALITY
-            </h2>
-        </td>
-    </tr>
-    '''
-
-    for article in articles:
-        summary = article.ai_summary if article.ai_summary else article.summary
-
-        grain_html += f'''
-    <tr>
-        <td style="padding: 15px 30px; border-bottom: 1px solid #eee;">
-            <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-                <tr>
-                    <td valign="top" width="100%">
-                        <h3 style="color: #1a1a2e; margin: 0 0 10px 0; font-size: 15px; font-weight: 600; line-height: 1.4;">
-                            <a href="{article.url}" style="color: #1a1a2e; text-decoration: none;">{article.title}</a>
-                        </h3>
-                        {format_paragraphs(summary)}
-                        <p style="margin: 0; margin-top: 8px;">
-                            <a href="{article.url}" style="color: #667eea; text-decoration: none; font-size: 12px; font-weight: 500;">Read more →</a>
-                        </p>
-                    </td>
-                </tr>
-            </table>
-        </td>
-    </tr>
-    '''
-
-    return grain_html
+    return _section(articles, 'GRAIN QUALITY', '🌾', show_source=False)
 
 
 def format_newsletter_html_sections(selected_articles: dict, config: dict) -> str:
@@ -517,16 +269,21 @@ def format_newsletter_html_sections(selected_articles: dict, config: dict) -> st
     newsletter_name = newsletter_config.get('name', 'AI This Week')
     tagline = newsletter_config.get('tagline', 'Key AI Developments You Should Know')
 
-    today = datetime.now()
-    week_of = format_date(today)
+    week_of = _week_of(date.today().toordinal())
+
+    # Build sections, skipping the builder call entirely for empty ones
+    headlines = selected_articles.get('headlines')
+    bright_spots = selected_articles.get('bright_spots')
+    tools = selected_articles.get('tools')
+    deep_dives = selected_articles.get('deep_dives')
+    grain_quality = selected_articles.get('grain_quality')
 
-    # Build sections
-    headlines_html = build_headline_section(selected_articles.get('headlines', []))
-    bright_spot_html = build_bright_spot_section(selected_articles.get('bright_spots', []))
-    tool_html = build_tool_section(selected_articles.get('tools', []))
+    headlines_html = build_headline_section(headlines) if headlines else ''
+    bright_spot_html = build_bright_spot_section(bright_spots) if bright_spots else ''
+    tool_html = build_tool_section(tools) if tools else ''
     learning_html = build_learning_section()
-    deep_dive_html = build_deep_dive_section(selected_articles.get('deep_dives', []))
-    grain_html = build_grain_quality_section(selected_articles.get('grain_quality', []))
+    deep_dive_html = build_deep_dive_section(deep_dives) if deep_dives else ''
+    grain_html = build_grain_quality_section(grain_quality) if grain_quality else ''
 
     # Build Theme of the Week section
     theme_of_week = selected_articles.get('theme_of_week')
@@ -539,8 +296,8 @@ def format_newsletter_html_sections(selected_articles: dict, config: dict) -> st
                     <tr>
                         <td style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 25px 30px;">
                             <h2 style="color: #ffffff; margin: 0 0 5px 0; font-size: 12px; text-transform: uppercase; letter-spacing: 2px; opacity: 0.8;">💡 Theme of the Week</h2>
-                            <h3 style="color: #ffffff; margin: 0 0 15px 0; font-size: 20px; font-weight: 600; line-height: 1.3;">{theme_of_week.get('title', '')}</h3>
-                            <p style="color: #e8e8ff; margin: 0; font-size: 15px; line-height: 1.7; font-style: italic;">{theme_of_week.get('content', '')}</p>
+                            <h3 style="color: #ffffff; margin: 0 0 15px 0; font-size: 20px; font-weight: 600; line-height: 1.3;">{_esc(theme_of_week.get('title', ''))}</h3>
+                            <p style="color: #e8e8ff; margin: 0; font-size: 15px; line-height: 1.7; font-style: italic;">{_esc(theme_of_week.get('content', ''))}</p>
                         </td>
                     </tr>
                 </table>
@@ -548,109 +305,56 @@ def format_newsletter_html_sections(selected_articles: dict, config: dict) -> st
         </tr>
         '''
 
-    # Complete HTML
-    html = f'''<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{newsletter_name} - {week_of}</title>
-    <!--[if mso]>
-    <style type="text/css">
-        body, table, td {{font-family: Arial, Helvetica, sans-serif !important;}}
-        .article-title {{font-size: 16px !important;}}
-    </style>
-    <![endif]-->
-    <style>
-        @media only screen and (max-width: 600px) {{
-            .container {{ width: 100% !important; }}
-        }}
-    </style>
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f4f4f4; -webkit-font-smoothing: antialiased;">
-    <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0">
-        <tr>
-            <td align="center" style="padding: 20px 10px;">
-                <table role="presentation" class="container" width="650" cellspacing="0" cellpadding="0" border="0" style="background-color: #ffffff; border-radius: 8px; overflow: hidden; box-shadow: 0 4px 12px rgba(0,0,0,0.1);">
-
-                    <!-- Header -->
-                    <tr>
-                        <td style="background-color: #1a1a2e; padding: 35px 30px; text-align: center;">
-                            <h1 style="color: #ffffff; margin: 0; font-size: 28px; font-weight: 700; letter-spacing: -0.5px;">
-                                🤖 {newsletter_name}
-                            </h1>
-                            <p style="color: #a0a0a0; margin: 10px 0 0 0; font-size: 14px; font-weight: 400;">{tagline}</p>
-                        </td>
-                    </tr>
-
-                    <!-- Intro -->
-                    <tr>
-                        <td style="padding: 25px 30px; border-bottom: 1px solid #eee;">
-                            <p style="color: #444444; margin: 0; font-size: 15px; line-height: 1.6;">
-                                <strong>Hello,</strong>
-                            </p>
-                            <p style="color: #444444; margin: 10px 0 0 0; font-size: 15px; line-height: 1.6;">
-                                Here's your weekly update on the latest in AI.
-                            </p>
-                            <p style="color: #888888; margin: 10px 0 0 0; font-size: 13px;">
-                                📅 Week of {week_of}
-                            </p>
-                        </td>
-                    </tr>
-
-                    <!-- Headline Summary -->
-                    {headlines_html}
-
-                    <!-- Bright Spot -->
-                    {bright_spot_html}
+    return _SECTIONS_TMPL.render(
+        newsletter_name=newsletter_name,
+        tagline=tagline,
+        week_of=week_of,
+        headlines_html=headlines_html,
+        bright_spot_html=bright_spot_html,
+        tool_html=tool_html,
+        theme_html=theme_html,
+        learning_html=learning_html,
+        deep_dive_html=deep_dive_html,
+        grain_html=grain_html,
+    )
 
-                    <!-- Tool of the Week -->
-                    {tool_html}
 
-                    <!-- Theme of the Week -->
-                    {theme_html}
+# Output directories already created by save_newsletter in this process
+_dirs_made = set()
 
-                    <!-- Learning -->
-                    {learning_html}
 
-                    <!-- Deep Dive -->
-                    {deep_dive_html}
-
-                    <!-- Grain Quality (optional) -->
-                    {grain_html}
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="background-color: #1a1a2e; padding: 25px 30px; text-align: center;">
-                            <p style="color: #888888; margin: 0 0 5px 0; font-size: 12px;">
-                                Curated with 🤖 by Scott's AI Newsletter Bot
-                            </p>
-                            <p style="color: #666666; margin: 0; font-size: 11px;">
-                                {today.strftime("%B %d, %Y")}
-                            </p>
-                        </td>
-                    </tr>
-
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>'''
-
-    return html
-
-
-def save_newsletter(html: str, output_dir: Path, filename: str = None) -> Path:
-    """Save newsletter HTML to file."""
-    output_dir.mkdir(parents=True, exist_ok=True)
+def save_newsletter(html: Union[str, bytes, Iterable[str]], output_dir: Path, filename: str = None) -> Path:
+    """Save newsletter HTML (text, UTF-8 bytes, or streamed text chunks) to file."""
+    if output_dir not in _dirs_made:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _dirs_made.add(output_dir)
 
     if not filename:
         filename = f"newsletter_{datetime.now().strftime('%Y-%m-%d')}.html"
 
     output_path = output_dir / filename
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    if isinstance(html, str):
+        html = html.encode('utf-8')
+
+    # Write to a temp file and rename so readers never see a partial newsletter
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        f = open(tmp_path, 'wb')
+    except FileNotFoundError:
+        # Directory was removed since we created it
+        output_dir.mkdir(parents=True, exist_ok=True)
+        f = open(tmp_path, 'wb')
+    try:
+        with f:
+            if isinstance(html, bytes):
+                f.write(html)
+            else:
+                for chunk in html:
+                    f.write(chunk.encode('utf-8'))
+    except BaseException:
+        # Rendering or writing failed partway; don't leave the partial file behind
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, output_path)
 
     return output_path
@@ -4,33 +4,82 @@ Logging configuration module.
 Provides centralized logging setup with proper levels and formatting.
 """
 
+import atexit
 import logging
+import logging.handlers
 import sys
+import time
+import weakref
 from pathlib import Path
 from typing import Optional
 
+# File-buffering handlers created by setup_logger, flushed once at exit
+_buffered_handlers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_handlers() -> None:
+    """Write out buffered records below ERROR on a normal exit."""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+class _CachedFormatter(logging.Formatter):
+    """Formatter that only re-formats the timestamp when the second changes."""
+
+    _cache = (None, '')
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, text = self._cache
+        if second != cached_second:
+            text = time.strftime(datefmt or '%Y-%m-%d %H:%M:%S', self.converter(second))
+            # Single tuple assignment keeps second and text consistent across threads
+            self._cache = (second, text)
+        return text
+
 
 def setup_logger(name: str = "newsletter_bot", level: str = "INFO",
-                 log_file: Optional[Path] = None) -> logging.Logger:
+                 log_file: Optional[Path] = None, force: bool = False) -> logging.Logger:
     """
     Setup and configure logger for the application.
 
+    Repeat calls for an already configured logger only apply a new level;
+    set force to rebuild the handlers (e.g. to switch log_file).
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to log to
+        force: Rebuild handlers even if the logger is already configured
 
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    if getattr(logger, '_configured', False) and not force:
+        logger.setLevel(level)
+        for handler in logger.handlers:
+            handler.setLevel(level)
+        if log_file != logger._log_file:
+            logger.debug("Logger %s already configured; ignoring log_file=%s (use force=True)",
+                         name, log_file)
+        return logger
+
     logger.setLevel(level)
 
-    # Clear existing handlers
-    logger.handlers.clear()
+    # Flush and close existing handlers (including a buffered file target) before replacing them
+    for handler in list(logger.handlers):
+        target = getattr(handler, 'target', None)
+        handler.flush()
+        handler.close()
+        if target is not None:
+            target.close()
+        logger.removeHandler(handler)
+        _buffered_handlers.discard(handler)
 
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = _CachedFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -41,14 +90,21 @@ def setup_logger(name: str = "newsletter_bot", level: str = "INFO",
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # File handler (if specified)
+    # File handler (if specified), buffered so routine lines are written in batches
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        memory_handler.setLevel(level)
+        logger.addHandler(memory_handler)
+        _buffered_handlers.add(memory_handler)
 
+    logger._configured = True
+    logger._log_file = log_file
     return logger
 
 
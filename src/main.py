@@ -24,6 +24,11 @@ from datetime import datetime
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -32,7 +37,7 @@ from logger import setup_logger
 from sources.rss_fetcher import fetch_all_articles
 from processors.scorer import score_articles, get_top_articles, print_article_rankings
 from processors.summarizer import summarize_articles, generate_deep_dive_topic
-from formatters.email_formatter import format_newsletter_html, save_newsletter
+from formatters.email_formatter import iter_newsletter_html, save_newsletter
 
 logger = setup_logger("main")
 
@@ -45,12 +50,22 @@ def save_articles_json(articles, output_dir: Path):
     
     data = [a.to_dict() for a in articles]
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, default=str)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, default=str)
         
     return output_file
 
 
+def print_banner(title: str, leading_newline: bool = True):
+    """Print a step banner with a single write."""
+    rule = "=" * 60
+    prefix = "\n" if leading_newline else ""
+    print(f"{prefix}{rule}\n{title}\n{rule}")
+
+
 def main():
     """Main entry point for the newsletter bot."""
     parser = argparse.ArgumentParser(description='AI Newsletter Bot')
@@ -65,11 +80,8 @@ def main():
     
     args = parser.parse_args()
 
-    print("=" * 60)
-    print("🤖 AI Newsletter Bot")
-    print("=" * 60)
-    print(f"📅 Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print()
+    print_banner("🤖 AI Newsletter Bot", leading_newline=False)
+    print(f"📅 Run time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     logger.info("Starting newsletter bot")
 
@@ -79,15 +91,19 @@ def main():
         logger.info("Configuration loaded successfully")
     except ConfigError as e:
         print(f"❌ Configuration error: {e}")
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         sys.exit(1)
 
-    newsletter_config = config.get('newsletter', {})
+    newsletter_config = config.get('newsletter') or {}
+    alert_count = len(config.get('google_alerts') or [])
+    feed_count = len(config.get('rss_feeds') or [])
 
-    print(f"📰 Newsletter: {newsletter_config.get('name', 'AI This Week')}")
-    print(f"📬 Google Alerts: {len(config.get('google_alerts', []))} configured")
-    print(f"📡 RSS Feeds: {len(config.get('rss_feeds', []))} configured")
-    logger.info(f"Configuration: {len(config.get('google_alerts', []))} Google Alerts, {len(config.get('rss_feeds', []))} RSS feeds")
+    print(
+        f"📰 Newsletter: {newsletter_config.get('name', 'AI This Week')}\n"
+        f"📬 Google Alerts: {alert_count} configured\n"
+        f"📡 RSS Feeds: {feed_count} configured"
+    )
+    logger.info("Configuration: %d Google Alerts, %d RSS feeds", alert_count, feed_count)
     
     # Determine max articles
     max_articles = args.max_articles or newsletter_config.get('max_articles', 8)
@@ -95,9 +111,7 @@ def main():
     # ========================================
     # Step 1: Fetch articles from all sources
     # ========================================
-    print("\n" + "=" * 60)
-    print("📥 STEP 1: Fetching Articles")
-    print("=" * 60)
+    print_banner("📥 STEP 1: Fetching Articles")
 
     logger.info("Starting article fetch")
     articles = fetch_all_articles(config)
@@ -107,19 +121,17 @@ def main():
         logger.error("No articles found after fetching from all sources")
         sys.exit(1)
 
-    logger.info(f"Fetched {len(articles)} articles from all sources")
+    logger.info("Fetched %d articles from all sources", len(articles))
     
     # ========================================
     # Step 2: Score and rank articles
     # ========================================
-    print("\n" + "=" * 60)
-    print("📊 STEP 2: Scoring & Ranking")
-    print("=" * 60)
+    print_banner("📊 STEP 2: Scoring & Ranking")
 
-    logger.info(f"Scoring {len(articles)} articles")
+    logger.info("Scoring %d articles", len(articles))
     scored_articles = score_articles(articles, config)
     top_articles = get_top_articles(scored_articles, max_articles)
-    logger.info(f"Selected top {len(top_articles)} articles out of {len(scored_articles)}")
+    logger.info("Selected top %d articles out of %d", len(top_articles), len(scored_articles))
 
     print_article_rankings(scored_articles, top_n=15)
 
@@ -127,7 +139,7 @@ def main():
     output_dir = Path(__file__).parent.parent / "output"
     json_file = save_articles_json(scored_articles, output_dir)
     print(f"\n💾 Saved all articles to: {json_file}")
-    logger.info(f"Saved articles to {json_file}")
+    logger.info("Saved articles to %s", json_file)
     
     if args.fetch_only:
         print("\n✅ Fetch complete (--fetch-only mode)")
@@ -138,9 +150,7 @@ def main():
     # Step 3: Generate AI summaries
     # ========================================
     if not args.no_ai:
-        print("\n" + "=" * 60)
-        print("🤖 STEP 3: AI Summarization")
-        print("=" * 60)
+        print_banner("🤖 STEP 3: AI Summarization")
 
         logger.info("Starting AI summarization")
         api_key = os.getenv('GEMINI_API_KEY')
@@ -149,7 +159,7 @@ def main():
             print("   Set it with: $env:GEMINI_API_KEY='your-key-here'")
             logger.warning("GEMINI_API_KEY not set - using original summaries")
         else:
-            logger.info(f"Summarizing {len(top_articles)} articles with Gemini")
+            logger.info("Summarizing %d articles with Gemini", len(top_articles))
             top_articles = summarize_articles(top_articles, config)
 
             # Generate deep dive suggestion
@@ -164,12 +174,10 @@ def main():
     # ========================================
     # Step 4: Format newsletter
     # ========================================
-    print("\n" + "=" * 60)
-    print("📧 STEP 4: Formatting Newsletter")
-    print("=" * 60)
+    print_banner("📧 STEP 4: Formatting Newsletter")
 
     logger.info("Formatting newsletter HTML")
-    html = format_newsletter_html(
+    html = iter_newsletter_html(
         articles=top_articles,
         config=config,
         deep_dive=deep_dive if not args.no_ai else None
@@ -178,7 +186,7 @@ def main():
     # Save newsletter
     output_file = save_newsletter(html, output_dir)
     print(f"\n✅ Newsletter saved to: {output_file}")
-    logger.info(f"Newsletter saved to {output_file}")
+    logger.info("Newsletter saved to %s", output_file)
 
     # Open in browser if requested
     if args.preview:
@@ -186,14 +194,13 @@ def main():
         logger.info("Opening newsletter in browser")
         webbrowser.open(f'file://{output_file.absolute()}')
 
-    print("\n" + "=" * 60)
-    print("✅ COMPLETE!")
-    print("=" * 60)
-    print(f"\nNext steps:")
-    print(f"  1. Review: {output_file}")
-    print(f"  2. Edit articles if needed: {json_file}")
-    print(f"  3. Copy HTML into Outlook email")
-    print()
+    print_banner("✅ COMPLETE!")
+    print(
+        f"\nNext steps:\n"
+        f"  1. Review: {output_file}\n"
+        f"  2. Edit articles if needed: {json_file}\n"
+        f"  3. Copy HTML into Outlook email\n"
+    )
     logger.info("Newsletter generation complete")
 
 
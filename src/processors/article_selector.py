@@ -16,12 +16,17 @@ Enforces selection rules:
 """
 
 import logging
+from collections import Counter
+from itertools import islice
 from typing import List, Dict, Optional
 import sys
 from pathlib import Path
 
-# Import Article model
-sys.path.append(str(Path(__file__).parent.parent))
+# Import Article model (`processors` is imported as a top-level package from
+# src/, so a relative import past the package is not possible)
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 from sources.rss_fetcher import Article
 
 logger = logging.getLogger(__name__)
@@ -70,6 +75,12 @@ GOVERNANCE_KEYWORDS = [
     'framework'
 ]
 
+# Keywords for detecting Canadian relevance
+CANADIAN_ANGLE_KEYWORDS = [
+    'canada', 'canadian', 'toronto', 'montreal', 'ottawa', 'vancouver', 'bc', 'alberta',
+    'quebec', 'ontario', 'manitoba', 'nova scotia'
+]
+
 
 def is_canadian_government_story(article: Article) -> bool:
     """Check if article is about Canadian government AI initiatives."""
@@ -85,23 +96,21 @@ def is_governance_story(article: Article) -> bool:
 
 def is_canadian_angle(article: Article) -> bool:
     """Check if article mentions Canada or has Canadian relevance."""
-    canadian_keywords = ['canada', 'canadian', 'toronto', 'montreal', 'ottawa', 'vancouver', 'bc', 'alberta',
-                         'quebec', 'ontario', 'manitoba', 'nova scotia']
     text = (article.title + " " + article.summary + " " + article.source).lower()
-    return any(keyword in text for keyword in canadian_keywords)
+    return any(keyword in text for keyword in CANADIAN_ANGLE_KEYWORDS)
 
 
 def find_canadian_government_stories(articles: List[Article]) -> List[Article]:
     """Find Canadian government AI stories from headlines."""
     gov_stories = [a for a in articles if is_canadian_government_story(a)]
-    logger.info(f"Found {len(gov_stories)} Canadian government stories")
+    logger.info("Found %d Canadian government stories", len(gov_stories))
     return gov_stories
 
 
 def find_governance_stories(articles: List[Article]) -> List[Article]:
     """Find governance/regulation stories from headlines."""
     gov_stories = [a for a in articles if is_governance_story(a)]
-    logger.info(f"Found {len(gov_stories)} governance/regulation stories")
+    logger.info("Found %d governance/regulation stories", len(gov_stories))
     return gov_stories
 
 
@@ -111,33 +120,27 @@ def check_sentiment_distribution(selected_articles: Dict[str, List[Article]]) ->
 
     Target: 40% concerns (negative), 35% opportunities (positive), 25% neutral
     """
-    all_articles = []
-    for articles_list in selected_articles.values():
-        all_articles.extend(articles_list)
-
-    if not all_articles:
+    sentiments = Counter(
+        getattr(article, 'sentiment', 'neutral')
+        for articles_list in selected_articles.values()
+        for article in articles_list
+    )
+    total = sum(sentiments.values())
+
+    if not total:
         logger.warning("No articles to check sentiment distribution")
         return {}
 
-    # Count sentiments
-    sentiments = {}
-    for article in all_articles:
-        sentiment = getattr(article, 'sentiment', 'neutral')
-        sentiments[sentiment] = sentiments.get(sentiment, 0) + 1
-
-    total = len(all_articles)
     distribution = {
-        'positive': sentiments.get('positive', 0) / total if total > 0 else 0,
-        'negative': sentiments.get('negative', 0) / total if total > 0 else 0,
-        'neutral': sentiments.get('neutral', 0) / total if total > 0 else 0,
-        'mixed': sentiments.get('mixed', 0) / total if total > 0 else 0,
+        key: sentiments[key] / total
+        for key in ('positive', 'negative', 'neutral', 'mixed')
     }
 
-    logger.info(f"Sentiment distribution:")
-    logger.info(f"  Positive (opportunities): {distribution['positive']:.0%} (target 35%)")
-    logger.info(f"  Negative (concerns): {distribution['negative']:.0%} (target 40%)")
-    logger.info(f"  Neutral: {distribution['neutral']:.0%} (target 25%)")
-    logger.info(f"  Mixed: {distribution['mixed']:.0%}")
+    logger.info("Sentiment distribution:")
+    logger.info("  Positive (opportunities): %.0f%% (target 35%%)", distribution['positive'] * 100)
+    logger.info("  Negative (concerns): %.0f%% (target 40%%)", distribution['negative'] * 100)
+    logger.info("  Neutral: %.0f%% (target 25%%)", distribution['neutral'] * 100)
+    logger.info("  Mixed: %.0f%%", distribution['mixed'] * 100)
 
     # Check if distribution is balanced
     pos_target = 0.35
@@ -147,12 +150,14 @@ def check_sentiment_distribution(selected_articles: Dict[str, List[Article]]) ->
 
     if abs(distribution['positive'] - pos_target) > tolerance:
         logger.warning(
-            f"⚠️  Positive sentiment imbalance: {distribution['positive']:.0%}, target {pos_target:.0%}"
+            "⚠️  Positive sentiment imbalance: %.0f%%, target %.0f%%",
+            distribution['positive'] * 100, pos_target * 100
         )
 
     if abs(distribution['negative'] - neg_target) > tolerance:
         logger.warning(
-            f"⚠️  Negative sentiment imbalance: {distribution['negative']:.0%}, target {neg_target:.0%}"
+            "⚠️  Negative sentiment imbalance: %.0f%%, target %.0f%%",
+            distribution['negative'] * 100, neg_target * 100
         )
 
     return distribution
@@ -185,12 +190,12 @@ def auto_select_articles(
     """
 
     # Extract section configuration
-    section_config = config.get('sections', {})
-    headlines_config = section_config.get('headlines', {})
-    bright_spots_config = section_config.get('bright_spots', {})
-    tools_config = section_config.get('tools', {})
-    deep_dives_config = section_config.get('deep_dives', {})
-    grain_config = section_config.get('grain_quality', {})
+    section_config = config.get('sections') or {}
+    headlines_config = section_config.get('headlines') or {}
+    bright_spots_config = section_config.get('bright_spots') or {}
+    tools_config = section_config.get('tools') or {}
+    deep_dives_config = section_config.get('deep_dives') or {}
+    grain_config = section_config.get('grain_quality') or {}
 
     # Target counts
     target_headlines = headlines_config.get('target_count', 8)  # 8-10, use min
@@ -208,13 +213,10 @@ def auto_select_articles(
         'grain_quality': []
     }
 
+    # Unknown sections fall back to headline
+    headlines = classified_articles['headline']
     for article in scored_articles:
-        section = getattr(article, 'section', 'headline')
-        if section in classified_articles:
-            classified_articles[section].append(article)
-        else:
-            # Default to headline if unknown section
-            classified_articles['headline'].append(article)
+        classified_articles.get(article.section, headlines).append(article)
 
     # Initialize selection
     selection = {
@@ -226,103 +228,107 @@ def auto_select_articles(
     }
 
     # ===== HEADLINES SELECTION =====
-    logger.info(f"\n🔍 Selecting headlines ({target_headlines} target)...")
+    logger.info("\n🔍 Selecting headlines (%d target)...", target_headlines)
 
     # Rule 1: At least 1 Canadian government story
+    selected_ids = set()  # id() of articles already in selection['headlines']
     canadian_gov_stories = find_canadian_government_stories(classified_articles['headline'])
     if canadian_gov_stories:
         selection['headlines'].append(canadian_gov_stories[0])
-        logger.info(f"✓ Added Canadian government story: {canadian_gov_stories[0].title[:60]}")
+        selected_ids.add(id(canadian_gov_stories[0]))
+        logger.info("✓ Added Canadian government story: %.60s", canadian_gov_stories[0].title)
     elif warn_on_missing:
         logger.warning("⚠️  No Canadian government story found in headlines!")
 
     # Rule 2: At least 1 governance/regulation story
     governance_stories = find_governance_stories(classified_articles['headline'])
+    # Remember which headlines are governance stories so they aren't re-scanned below
+    governance_ids = {id(a) for a in governance_stories}
     governance_story_to_add = None
     if governance_stories:
         # Avoid duplicate with Canadian gov story
         governance_story_to_add = next(
-            (a for a in governance_stories if a not in selection['headlines']),
+            (a for a in governance_stories if id(a) not in selected_ids),
             None
         )
         if governance_story_to_add:
             selection['headlines'].append(governance_story_to_add)
-            logger.info(f"✓ Added governance story: {governance_story_to_add.title[:60]}")
+            selected_ids.add(id(governance_story_to_add))
+            logger.info("✓ Added governance story: %.60s", governance_story_to_add.title)
     elif warn_on_missing:
         logger.warning("⚠️  No governance/regulation story found in headlines!")
 
     # Rule 3: Fill remaining headlines with 60/40 governance/capabilities mix
-    remaining_headlines = [
-        a for a in classified_articles['headline']
-        if a not in selection['headlines']
-    ]
-
-    # Separate by governance vs other
-    governance_articles = [a for a in remaining_headlines if is_governance_story(a)]
-    other_articles = [a for a in remaining_headlines if a not in governance_articles]
+    # Split the unselected headlines into governance vs other in one pass
+    governance_articles = []
+    other_articles = []
+    for a in classified_articles['headline']:
+        if id(a) in selected_ids:
+            continue
+        (governance_articles if id(a) in governance_ids else other_articles).append(a)
 
     # Calculate how many more we need
     needed = target_headlines - len(selection['headlines'])
     target_governance = max(0, int(target_headlines * governance_ratio))
-    current_governance = len([a for a in selection['headlines'] if is_governance_story(a)])
+    current_governance = sum(1 for a in selection['headlines'] if id(a) in governance_ids)
     needed_governance = max(0, target_governance - current_governance)
     needed_other = needed - needed_governance
 
     # Add governance articles
-    selection['headlines'].extend(governance_articles[:needed_governance])
+    selection['headlines'].extend(islice(governance_articles, needed_governance))
     # Add other articles (capabilities, research, etc.)
-    selection['headlines'].extend(other_articles[:needed_other])
+    selection['headlines'].extend(islice(other_articles, max(0, needed_other)))
 
-    logger.info(f"✓ Selected {len(selection['headlines'])} headlines " +
-                f"({governance_ratio:.0%} governance, {1-governance_ratio:.0%} other)")
+    logger.info("✓ Selected %d headlines (%.0f%% governance, %.0f%% other)",
+                len(selection['headlines']), governance_ratio * 100, (1 - governance_ratio) * 100)
 
     # ===== BRIGHT SPOTS SELECTION =====
-    logger.info(f"\n✨ Selecting bright spots ({target_bright_spots} target)...")
+    logger.info("\n✨ Selecting bright spots (%d target)...", target_bright_spots)
     selection['bright_spots'] = classified_articles['bright_spot'][:target_bright_spots]
     if selection['bright_spots']:
-        logger.info(f"✓ Selected {len(selection['bright_spots'])} bright spots")
+        logger.info("✓ Selected %d bright spots", len(selection['bright_spots']))
     else:
         logger.warning("⚠️  No bright spot stories found!")
 
     # ===== TOOLS SELECTION =====
-    logger.info(f"\n🛠️  Selecting tools ({target_tools} target)...")
+    logger.info("\n🛠️  Selecting tools (%d target)...", target_tools)
     selection['tools'] = classified_articles['tool'][:target_tools]
     if selection['tools']:
-        logger.info(f"✓ Selected {len(selection['tools'])} tools")
+        logger.info("✓ Selected %d tools", len(selection['tools']))
     else:
         logger.warning("⚠️  No tool stories found!")
 
     # ===== DEEP DIVES SELECTION =====
-    logger.info(f"\n📊 Selecting deep dives ({target_deep_dives} target)...")
+    logger.info("\n📊 Selecting deep dives (%d target)...", target_deep_dives)
     selection['deep_dives'] = classified_articles['deep_dive'][:target_deep_dives]
-    logger.info(f"✓ Selected {len(selection['deep_dives'])} deep dives")
+    logger.info("✓ Selected %d deep dives", len(selection['deep_dives']))
 
     # ===== GRAIN QUALITY SELECTION (optional) =====
     if grain_config.get('enabled', True):
-        logger.info(f"\n🌾 Selecting grain quality articles (optional)...")
+        logger.info("\n🌾 Selecting grain quality articles (optional)...")
         selection['grain_quality'] = classified_articles['grain_quality']
         if selection['grain_quality']:
-            logger.info(f"✓ Selected {len(selection['grain_quality'])} grain quality articles")
+            logger.info("✓ Selected %d grain quality articles", len(selection['grain_quality']))
         else:
-            logger.info(f"  No grain quality articles this week")
+            logger.info("  No grain quality articles this week")
 
     # ===== SENTIMENT BALANCE CHECK =====
-    logger.info(f"\n📈 Checking sentiment balance...")
+    logger.info("\n📈 Checking sentiment balance...")
     check_sentiment_distribution(selection)
 
     # Log final summary
-    logger.info(f"\n{'='*50}")
-    logger.info(f"📰 FINAL SELECTION SUMMARY")
-    logger.info(f"{'='*50}")
+    logger.info("\n%s", '=' * 50)
+    logger.info("📰 FINAL SELECTION SUMMARY")
+    logger.info('=' * 50)
     total_articles = sum(len(articles) for articles in selection.values())
-    logger.info(f"Headlines:     {len(selection['headlines']):2d} (target: {target_headlines})")
-    logger.info(f"Bright Spots:  {len(selection['bright_spots']):2d} (target: {target_bright_spots})")
-    logger.info(f"Tools:         {len(selection['tools']):2d} (target: {target_tools})")
-    logger.info(f"Deep Dives:    {len(selection['deep_dives']):2d} (target: {target_deep_dives})")
-    logger.info(f"Grain Quality: {len(selection['grain_quality']):2d} (optional)")
-    logger.info(f"{'─'*50}")
-    logger.info(f"Total:         {total_articles:2d} articles")
-    logger.info(f"{'='*50}")
+    logger.info("Headlines:     %2d (target: %d)", len(selection['headlines']), target_headlines)
+    logger.info("Bright Spots:  %2d (target: %d)", len(selection['bright_spots']), target_bright_spots)
+    logger.info("Tools:         %2d (target: %d)", len(selection['tools']), target_tools)
+    logger.info("Deep Dives:    %2d (target: %d)", len(selection['deep_dives']), target_deep_dives)
+    logger.info("Grain Quality: %2d (optional)", len(selection['grain_quality']))
+    logger.info('─' * 50)
+    logger.info("Total:         %2d articles", total_articles)
+    logger.info('=' * 50)
 
     return selection
 
@@ -333,14 +339,14 @@ def validate_selection(selection: Dict[str, List[Article]], config: dict) -> boo
 
     Returns: True if valid, False otherwise
     """
-    section_config = config.get('sections', {})
-    headlines_config = section_config.get('headlines', {})
+    section_config = config.get('sections') or {}
+    headlines_config = section_config.get('headlines') or {}
 
     valid = True
 
     # Check minimum headlines
     if len(selection['headlines']) < 6:
-        logger.error(f"❌ Not enough headlines: {len(selection['headlines'])} < 6")
+        logger.error("❌ Not enough headlines: %d < 6", len(selection['headlines']))
         valid = False
 
     # Check for required Canadian government story
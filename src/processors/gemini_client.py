@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Gemini Client Module
+
+Configures the google-generativeai SDK once per API key and shares
+GenerativeModel instances between the summarizer and section classifier,
+instead of rebuilding both on every request.
+"""
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+try:
+    import google.generativeai as genai
+    GEMINI_AVAILABLE = True
+except ImportError:
+    genai = None
+    GEMINI_AVAILABLE = False
+
+
+@lru_cache(maxsize=1)
+def configure_gemini(api_key: str) -> None:
+    """
+    Configure the Gemini SDK with an API key.
+
+    genai.configure replaces the SDK's global client settings, so it only
+    runs again when a different key is passed.
+    """
+    genai.configure(api_key=api_key)
+    logger.debug("Gemini API configured successfully")
+
+
+@lru_cache(maxsize=4)
+def get_model(model_name: str):
+    """Return the shared GenerativeModel for model_name, creating it on first use."""
+    return genai.GenerativeModel(model_name)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Gemini Response Parsing Module
+
+Extracts JSON payloads from Gemini text responses, which may arrive wrapped
+in markdown code fences or surrounded by explanatory prose.
+"""
+
+import json
+
+_decoder = json.JSONDecoder()
+
+
+def parse_json_response(text: str) -> dict:
+    """
+    Decode the first JSON object in a Gemini response.
+
+    Scans to the first '{' and decodes from there with raw_decode, so code
+    fences, a leading 'json' tag, or trailing text are ignored.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        The decoded JSON object
+
+    Raises:
+        json.JSONDecodeError: If the response contains no decodable object
+    """
+    start = text.find('{')
+    if start == -1:
+        raise json.JSONDecodeError("No JSON object in response", text, 0)
+    result, _ = _decoder.raw_decode(text, start)
+    return result
@@ -5,27 +5,126 @@ Article Scoring Module
 Scores and ranks articles based on relevance, recency, and topic matching.
 """
 
-from typing import List
+from typing import List, Tuple
 from datetime import datetime
+from operator import attrgetter
 import re
 import logging
 
-# Import from parent
+# Import from parent (`processors` is imported as a top-level package from
+# src/, so a relative import past the package is not possible)
 import sys
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+_SRC_DIR = str(Path(__file__).parent.parent)
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 from sources.rss_fetcher import Article
 
 logger = logging.getLogger(__name__)
 
+# Recency score indexed by days old: <=1 day 1.0, <=3 0.8, <=5 0.6, <=7 0.4, older 0.2
+_RECENCY_BY_DAYS_OLD = (1.0, 1.0, 0.8, 0.8, 0.6, 0.6, 0.4, 0.4, 0.2)
 
-def calculate_topic_score(article: Article, topics_config: dict) -> tuple[float, str]:
+# Keywords that earn the maple leaf in print_article_rankings
+_RANKING_CANADIAN_MARKERS = ('canada', 'canadian', 'toronto', 'montreal')
+
+# Base score multiplier per source priority
+_PRIORITY_SCORES = {
+    'high': 1.5,
+    'medium': 1.0,
+    'low': 0.5
+}
+
+
+def _article_text(article: Article) -> str:
+    """Lowercased title + summary used by all keyword checks.
+
+    Article.__post_init__ guarantees both fields are strings, so no None guards are needed.
+    """
+    return f"{article.title} {article.summary}".lower()
+
+
+def _lower_keywords(keywords) -> tuple:
+    """Lowercase a keyword list once."""
+    return tuple(kw.lower() for kw in keywords or ())
+
+
+def _normalize_topics_config(topics_config) -> List[Tuple[str, tuple, float, float]]:
+    """
+    Prepare topics for matching: (category, lowercased keywords, boost, max score) per topic.
+
+    Accepts both the YAML mapping format (``{category: {keywords, priority_boost}}``)
+    and the list format produced by ``load_config`` (``[{name, keywords, category, priority}]``).
+    """
+    if isinstance(topics_config, dict):
+        entries = topics_config.items()
+    elif isinstance(topics_config, list):
+        # load_config sets category to the YAML key unless the topic overrides it
+        entries = (
+            (topic.get('category') or topic.get('name', ''), topic)
+            for topic in topics_config if isinstance(topic, dict)
+        )
+    else:
+        logger.error(f"Error in calculate_topic_score: unsupported topics config {type(topics_config).__name__}")
+        return []
+
+    normalized = []
+    for category, config in entries:
+        if not config:
+            continue
+
+        # Empty keywords never counted as matches
+        keywords = tuple(kw.lower() for kw in config.get('keywords') or () if kw)
+        if not keywords:
+            continue
+
+        boost = config.get('priority_boost', config.get('priority', 1.0))
+
+        # Validate boost
+        try:
+            boost = float(boost)
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid boost value {boost} for category {category}, using 1.0")
+            boost = 1.0
+
+        # Upper bound on this topic's score (every keyword matched)
+        normalized.append((category, keywords, boost, len(keywords) * boost))
+    return normalized
+
+
+def _calculate_topic_score_fast(text_lower: str, normalized_topics) -> Tuple[float, str]:
+    """Topic score for already-lowercased text against normalized topics."""
+    best_score = 0.0
+    best_category = ""
+
+    for category, keywords, boost, max_score in normalized_topics:
+        # A topic that cannot beat the current best is skipped (ties keep the earlier topic)
+        if max_score <= best_score:
+            continue
+
+        # Count keyword matches (plain loop: no generator frame per keyword)
+        matches = 0
+        for kw in keywords:
+            if kw in text_lower:
+                matches += 1
+
+        if matches > 0:
+            category_score = matches * boost
+            if category_score > best_score:
+                best_score = category_score
+                best_category = category
+
+    return best_score, best_category
+
+
+def calculate_topic_score(article: Article, topics_config: dict, text_lower: str = None) -> tuple[float, str]:
     """
     Calculate topic relevance score and classify article.
 
     Args:
         article: Article to score
-        topics_config: Topics configuration dictionary
+        topics_config: Topics configuration (mapping or list format)
+        text_lower: Precomputed lowercased article text (computed if omitted)
 
     Returns:
         Tuple of (score_boost, matched_category)
@@ -39,103 +138,68 @@ def calculate_topic_score(article: Article, topics_config: dict) -> tuple[float,
         if not topics_config:
             return 0.0, ""
 
-        # Build text for matching (handle None values)
-        title = article.title or ""
-        summary = article.summary or ""
-        text = f"{title} {summary}".lower()
-
-        best_score = 0.0
-        best_category = ""
-
-        for category, config in topics_config.items():
-            if not config:
-                continue
-
-            keywords = config.get('keywords', [])
-            if not keywords:
-                continue
-
-            boost = config.get('priority_boost', 1.0)
-
-            # Validate boost
-            try:
-                boost = float(boost)
-            except (ValueError, TypeError):
-                logger.warning(f"Invalid boost value {boost} for category {category}, using 1.0")
-                boost = 1.0
-
-            # Count keyword matches
-            matches = sum(1 for kw in keywords if kw and kw.lower() in text)
-
-            if matches > 0:
-                category_score = matches * boost
-                if category_score > best_score:
-                    best_score = category_score
-                    best_category = category
-
-        return best_score, best_category
+        text = text_lower if text_lower is not None else _article_text(article)
+        return _calculate_topic_score_fast(text, _normalize_topics_config(topics_config))
 
     except Exception as e:
         logger.error(f"Error in calculate_topic_score: {e}")
         return 0.0, ""
 
 
-def calculate_canadian_score(article: Article, canadian_keywords: List[str], boost: float) -> float:
-    """
-    Calculate Canadian content relevance boost.
-    """
-    text = f"{article.title} {article.summary}".lower()
-    
-    matches = sum(1 for kw in canadian_keywords if kw.lower() in text)
-    
+def _canadian_multiplier(text_lower: str, canadian_keywords_lower: tuple, boost: float) -> float:
+    """Canadian boost for already-lowercased text and keywords."""
+    matches = 0
+    for kw in canadian_keywords_lower:
+        if kw in text_lower:
+            matches += 1
+
     if matches > 0:
         return boost * min(matches, 3)  # Cap at 3x multiplier
     return 1.0
 
 
-def calculate_recency_score(article: Article) -> float:
+def calculate_canadian_score(article: Article, canadian_keywords: List[str], boost: float,
+                             text_lower: str = None) -> float:
+    """
+    Calculate Canadian content relevance boost.
+    """
+    text = text_lower if text_lower is not None else _article_text(article)
+    return _canadian_multiplier(text, _lower_keywords(canadian_keywords), boost)
+
+
+def calculate_recency_score(article: Article, now: datetime = None) -> float:
     """
     Calculate recency score - newer articles score higher.
+
+    ``now`` lets batch callers share one timestamp (defaults to the current time).
     """
     if not article.published:
         return 0.5
         
-    days_old = (datetime.now() - article.published).days
-    
-    if days_old <= 1:
-        return 1.0
-    elif days_old <= 3:
-        return 0.8
-    elif days_old <= 5:
-        return 0.6
-    elif days_old <= 7:
-        return 0.4
-    else:
-        return 0.2
+    days_old = ((now or datetime.now()) - article.published).days
+
+    # Clamp into the table: future-dated articles count as new, 8+ days as old
+    return _RECENCY_BY_DAYS_OLD[min(max(days_old, 0), len(_RECENCY_BY_DAYS_OLD) - 1)]
 
 
 def calculate_priority_score(article: Article) -> float:
     """
     Calculate base priority score from source configuration.
     """
-    priority_map = {
-        'high': 1.5,
-        'medium': 1.0,
-        'low': 0.5
-    }
-    return priority_map.get(article.priority, 1.0)
+    return _PRIORITY_SCORES.get(article.priority, 1.0)
+
 
+def _should_exclude_fast(text_lower: str, exclude_patterns_lower: tuple) -> bool:
+    """Exclusion check for already-lowercased text and patterns."""
+    return any(pattern in text_lower for pattern in exclude_patterns_lower)
 
-def should_exclude(article: Article, exclude_patterns: List[str]) -> bool:
+
+def should_exclude(article: Article, exclude_patterns: List[str], text_lower: str = None) -> bool:
     """
     Check if article should be excluded based on patterns.
     """
-    text = f"{article.title} {article.summary}".lower()
-    
-    for pattern in exclude_patterns:
-        if pattern.lower() in text:
-            return True
-    return False
+    text = text_lower if text_lower is not None else _article_text(article)
+    return _should_exclude_fast(text, _lower_keywords(exclude_patterns))
 
 
 def score_articles(articles: List[Article], config: dict) -> List[Article]:
@@ -149,23 +213,40 @@ def score_articles(articles: List[Article], config: dict) -> List[Article]:
     Returns:
         List of scored and sorted articles (highest score first)
     """
-    topics_config = config.get('topics', {})
-    canadian_keywords = config.get('canadian_keywords', [])
+    # Lowercase and validate keyword lists once, not per article
+    normalized_topics = _normalize_topics_config(config.get('topics', {}))
+    canadian_keywords_lower = _lower_keywords(config.get('canadian_keywords', []))
     canadian_boost = config.get('canadian_boost', 1.5)
-    exclude_patterns = config.get('exclude_patterns', [])
+    exclude_patterns_lower = _lower_keywords(config.get('exclude_patterns', []))
     
+    now = datetime.now()
     scored_articles = []
     
     for article in articles:
-        # Check exclusions
-        if should_exclude(article, exclude_patterns):
+        # Lowercase the text once and share it across all keyword checks
+        text_lower = _article_text(article)
+
+        # Exclusion and Canadian checks are inlined (same logic as _should_exclude_fast
+        # and _canadian_multiplier) to save two calls per fetched article
+        excluded = False
+        for pattern in exclude_patterns_lower:
+            if pattern in text_lower:
+                excluded = True
+                break
+        if excluded:
             continue
-            
+
         # Calculate component scores
-        topic_score, category = calculate_topic_score(article, topics_config)
-        canadian_multiplier = calculate_canadian_score(article, canadian_keywords, canadian_boost)
-        recency_score = calculate_recency_score(article)
-        priority_score = calculate_priority_score(article)
+        topic_score, category = _calculate_topic_score_fast(text_lower, normalized_topics)
+
+        canadian_matches = 0
+        for kw in canadian_keywords_lower:
+            if kw in text_lower:
+                canadian_matches += 1
+        canadian_multiplier = canadian_boost * min(canadian_matches, 3) if canadian_matches else 1.0  # Cap at 3x
+
+        recency_score = calculate_recency_score(article, now)
+        priority_score = _PRIORITY_SCORES.get(article.priority, 1.0)
         
         # Assign category
         article.category = category if category else article.category
@@ -181,7 +262,7 @@ def score_articles(articles: List[Article], config: dict) -> List[Article]:
         scored_articles.append(article)
         
     # Sort by score (highest first)
-    scored_articles.sort(key=lambda a: a.score, reverse=True)
+    scored_articles.sort(key=attrgetter('score'), reverse=True)
     
     return scored_articles
 
@@ -201,8 +282,8 @@ def print_article_rankings(articles: List[Article], top_n: int = 10):
     print("-" * 80)
     
     for i, article in enumerate(articles[:top_n], 1):
-        canadian = "🍁" if any(kw.lower() in f"{article.title} {article.summary}".lower() 
-                               for kw in ['canada', 'canadian', 'toronto', 'montreal']) else "  "
+        text_lower = _article_text(article)
+        canadian = "🍁" if any(kw in text_lower for kw in _RANKING_CANADIAN_MARKERS) else "  "
         
         print(f"{i:2}. [{article.score:5.2f}] {canadian} {article.title[:60]}")
         print(f"     📂 {article.category or 'uncategorized'} | 📰 {article.source}")
@@ -15,20 +15,26 @@ import json
 from typing import Optional
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import Article model
 sys.path.append(str(Path(__file__).parent.parent))
 from sources.rss_fetcher import Article
+from processors.response_parser import parse_json_response
+from processors.gemini_client import GEMINI_AVAILABLE, configure_gemini, get_model
 
 logger = logging.getLogger(__name__)
 
-# Try to import Gemini for sentiment detection
+# Try to import the on-disk cache for AI results
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    from cache import ai_cache_key, get_cached_ai_result, cache_ai_result
+    CACHE_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
+    CACHE_AVAILABLE = False
+    logger.debug("Cache module not available")
+
+if not GEMINI_AVAILABLE:
     logger.warning("google-generativeai not installed. Sentiment detection unavailable.")
 
 
@@ -102,6 +108,56 @@ GRAIN_QUALITY_KEYWORDS = [
     'farmer'
 ]
 
+# Source/text markers of academic publications
+ACADEMIC_SOURCE_KEYWORDS = ('arxiv', 'research paper', 'journal', 'university', 'academic')
+
+# Title words that together suggest a research write-up
+ACADEMIC_TITLE_INDICATORS = ('research', 'study', 'analysis', 'findings', 'model', 'framework', 'algorithm')
+
+LONG_FORM_KEYWORDS = ('white paper', 'report', 'analysis', 'deep dive')
+
+
+VALID_SENTIMENTS = ('positive', 'negative', 'neutral', 'mixed')
+
+SENTIMENT_DEFINITIONS = """DEFINITIONS:
+- positive: Breakthroughs, innovations, solutions, good news, success stories, medical advances
+- negative: Concerns, risks, problems, controversies, failures, security issues
+- neutral: Factual reporting without clear positive or negative tone
+- mixed: Contains both positive and negative elements"""
+
+
+def _validate_sentiment(value) -> str:
+    """Normalize a model-returned sentiment, falling back to 'neutral'."""
+    sentiment = str(value or 'neutral').lower()
+    if sentiment not in VALID_SENTIMENTS:
+        logger.warning(f"Invalid sentiment '{sentiment}', using 'neutral'")
+        sentiment = 'neutral'
+    return sentiment
+
+
+def _sentiment_cache_key(article: Article, gemini_config: dict) -> Optional[str]:
+    """Cache key for an article's sentiment (None when caching is unavailable)."""
+    if not CACHE_AVAILABLE:
+        return None
+    return ai_cache_key(
+        "sentiment", gemini_config.get('model', 'gemini-1.5-flash'), SENTIMENT_DEFINITIONS,
+        article.title, article.summary[:500]
+    )
+
+
+def _get_cached_sentiment(article: Article, gemini_config: dict) -> Optional[str]:
+    """Sentiment from an earlier run for the same article text, if any."""
+    cache_key = _sentiment_cache_key(article, gemini_config)
+    cached = get_cached_ai_result(cache_key) if cache_key else None
+    return cached.get('sentiment') if cached else None
+
+
+def _cache_sentiment(article: Article, gemini_config: dict, sentiment: str) -> None:
+    """Remember an API-derived sentiment for later runs."""
+    cache_key = _sentiment_cache_key(article, gemini_config)
+    if cache_key:
+        cache_ai_result(cache_key, {'sentiment': sentiment})
+
 
 def detect_sentiment(article: Article, gemini_config: dict) -> str:
     """
@@ -118,19 +174,18 @@ def detect_sentiment(article: Article, gemini_config: dict) -> str:
         logger.debug("GEMINI_API_KEY not set, skipping sentiment detection")
         return "neutral"
 
+    cached = _get_cached_sentiment(article, gemini_config)
+    if cached:
+        return cached
+
     try:
-        # Configure Gemini if not already done
-        genai.configure(api_key=api_key)
+        configure_gemini(api_key)
 
         model_name = gemini_config.get('model', 'gemini-1.5-flash')
 
         prompt = f"""Classify the sentiment of this article as one of: positive, negative, neutral, or mixed.
 
-DEFINITIONS:
-- positive: Breakthroughs, innovations, solutions, good news, success stories, medical advances
-- negative: Concerns, risks, problems, controversies, failures, security issues
-- neutral: Factual reporting without clear positive or negative tone
-- mixed: Contains both positive and negative elements
+{SENTIMENT_DEFINITIONS}
 
 Article Title: {article.title}
 Article Summary: {article.summary[:500]}
@@ -138,24 +193,12 @@ Article Summary: {article.summary[:500]}
 Respond with ONLY a JSON object (no markdown, no explanation):
 {{"sentiment": "positive|negative|neutral|mixed"}}"""
 
-        model = genai.GenerativeModel(model_name)
+        model = get_model(model_name)
         response = model.generate_content(prompt)
 
-        response_text = response.text.strip()
-
-        # Handle markdown code blocks
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-
-        result = json.loads(response_text)
-        sentiment = result.get('sentiment', 'neutral').lower()
-
-        # Validate sentiment value
-        if sentiment not in ['positive', 'negative', 'neutral', 'mixed']:
-            logger.warning(f"Invalid sentiment '{sentiment}', using 'neutral'")
-            sentiment = 'neutral'
+        result = parse_json_response(response.text)
+        sentiment = _validate_sentiment(result.get('sentiment'))
+        _cache_sentiment(article, gemini_config, sentiment)
 
         logger.debug(f"Sentiment for '{article.title[:50]}': {sentiment}")
         return sentiment
@@ -168,6 +211,73 @@ Respond with ONLY a JSON object (no markdown, no explanation):
         return "neutral"
 
 
+def _parse_batch_sentiments(result: dict) -> dict:
+    """
+    Map article number to sentiment from a batch response.
+
+    Gemini often returns ids as strings ("1"), so ids are coerced to int;
+    entries without a usable id are skipped.
+    """
+    by_id = {}
+    for entry in result.get('sentiments', []):
+        if not isinstance(entry, dict):
+            continue
+        try:
+            article_id = int(entry.get('id'))
+        except (TypeError, ValueError):
+            continue
+        by_id[article_id] = _validate_sentiment(entry.get('sentiment'))
+    return by_id
+
+
+def detect_sentiment_batch(articles: list, gemini_config: dict) -> list:
+    """
+    Classify the sentiment of several articles with a single Gemini request.
+
+    Falls back to per-article detect_sentiment for the whole batch if the response
+    can't be parsed, and for any article the response leaves out.
+
+    Returns: list of sentiments in the same order as ``articles``
+    """
+    if len(articles) <= 1 or not GEMINI_AVAILABLE or not os.getenv('GEMINI_API_KEY'):
+        return [detect_sentiment(article, gemini_config) for article in articles]
+
+    try:
+        configure_gemini(os.getenv('GEMINI_API_KEY'))
+        model_name = gemini_config.get('model', 'gemini-1.5-flash')
+
+        listing = "\n\n".join(
+            f"[{i}] Title: {article.title}\nSummary: {article.summary[:500]}"
+            for i, article in enumerate(articles, 1)
+        )
+        prompt = f"""Classify the sentiment of each numbered article as one of: positive, negative, neutral, or mixed.
+
+{SENTIMENT_DEFINITIONS}
+
+{listing}
+
+Respond with ONLY a JSON object (no markdown, no explanation):
+{{"sentiments": [{{"id": 1, "sentiment": "positive|negative|neutral|mixed"}}]}}"""
+
+        model = get_model(model_name)
+        response = model.generate_content(prompt)
+
+        by_id = _parse_batch_sentiments(parse_json_response(response.text))
+
+    except Exception as e:
+        logger.warning(f"Batch sentiment detection failed, retrying per article: {e}")
+        return [detect_sentiment(article, gemini_config) for article in articles]
+
+    sentiments = []
+    for i, article in enumerate(articles, 1):
+        if i in by_id:
+            _cache_sentiment(article, gemini_config, by_id[i])
+            sentiments.append(by_id[i])
+        else:
+            sentiments.append(detect_sentiment(article, gemini_config))
+    return sentiments
+
+
 def has_positive_sentiment_keywords(title: str, summary: str) -> bool:
     """Check if article has positive sentiment keywords."""
     text = (title + " " + summary).lower()
@@ -185,16 +295,12 @@ def is_research_paper(article: Article) -> bool:
     text = (article.title + " " + article.source + " " + article.summary).lower()
 
     # Check for arxiv or research-heavy sources
-    if 'arxiv' in text:
-        return True
-
-    # Check source names
-    if any(keyword in text for keyword in ['arxiv', 'research paper', 'journal', 'university', 'academic']):
+    if any(keyword in text for keyword in ACADEMIC_SOURCE_KEYWORDS):
         return True
 
     # Check for academic keywords in title
-    academic_indicators = ['research', 'study', 'analysis', 'findings', 'model', 'framework', 'algorithm']
-    keyword_count = sum(1 for keyword in academic_indicators if keyword in article.title.lower())
+    title = article.title.lower()
+    keyword_count = sum(1 for keyword in ACADEMIC_TITLE_INDICATORS if keyword in title)
 
     return keyword_count >= 2
 
@@ -210,7 +316,7 @@ def is_long_form(article: Article) -> bool:
 
     # Check for report/whitepaper keywords
     text = (article.title + " " + article.source).lower()
-    if any(keyword in text for keyword in ['white paper', 'report', 'analysis', 'deep dive']):
+    if any(keyword in text for keyword in LONG_FORM_KEYWORDS):
         return True
 
     return False
@@ -222,6 +328,59 @@ def has_grain_keywords(article: Article) -> bool:
     return any(keyword in text for keyword in GRAIN_QUALITY_KEYWORDS)
 
 
+def _keyword_section(article: Article) -> Optional[str]:
+    """Return the section decided by keywords alone, or None if sentiment is needed."""
+    # Special case: Grain quality (can co-exist with other sections)
+    if has_grain_keywords(article):
+        # Note: In practice, we'll return grain_quality but also classify for other sections
+        # For now, we prioritize this as a primary section
+        return "grain_quality"
+
+    # Tool detection (high priority)
+    if article.category == 'tools' or has_tool_keywords(article.title, article.summary):
+        return "tool"
+
+    # Deep dive detection (research papers or long-form analysis)
+    if is_research_paper(article) or is_long_form(article):
+        return "deep_dive"
+
+    return None
+
+
+def _prefetch_sentiments(articles: list, config: dict) -> None:
+    """
+    Detect sentiment concurrently for articles that will reach the bright spot check.
+
+    Articles are grouped gemini.batch_size per request, and requests run on a thread
+    pool bounded by gemini.max_concurrent; results are stored on the articles.
+    Sentiments cached by an earlier run are reused without a request.
+    """
+    gemini_config = config.get('gemini', {})
+    pending = []
+    for article in articles:
+        if article.sentiment or _keyword_section(article) is not None:
+            continue
+        cached = _get_cached_sentiment(article, gemini_config)
+        if cached:
+            article.sentiment = cached
+        else:
+            pending.append(article)
+    if not pending:
+        return
+
+    batch_size = gemini_config.get('batch_size', 4)
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    max_workers = min(gemini_config.get('max_concurrent', 3), len(batches))
+    logger.info(f"Detecting sentiment for {len(pending)} articles in {len(batches)} requests "
+                f"(max {max_workers} concurrent)")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(lambda batch: detect_sentiment_batch(batch, gemini_config), batches)
+        for batch, sentiments in zip(batches, results):
+            for article, sentiment in zip(batch, sentiments):
+                article.sentiment = sentiment
+
+
 def classify_article_section(
     article: Article,
     config: dict,
@@ -239,22 +398,10 @@ def classify_article_section(
         Section name: "headline", "bright_spot", "tool", "deep_dive", "grain_quality"
     """
 
-    # Special case: Grain quality (can co-exist with other sections)
-    if has_grain_keywords(article):
-        logger.debug(f"Article '{article.title[:40]}' classified as grain_quality")
-        # Note: In practice, we'll return grain_quality but also classify for other sections
-        # For now, we prioritize this as a primary section
-        return "grain_quality"
-
-    # Tool detection (high priority)
-    if article.category == 'tools' or has_tool_keywords(article.title, article.summary):
-        logger.debug(f"Article '{article.title[:40]}' classified as tool")
-        return "tool"
-
-    # Deep dive detection (research papers or long-form analysis)
-    if is_research_paper(article) or is_long_form(article):
-        logger.debug(f"Article '{article.title[:40]}' classified as deep_dive")
-        return "deep_dive"
+    section = _keyword_section(article)
+    if section:
+        logger.debug(f"Article '{article.title[:40]}' classified as {section}")
+        return section
 
     # Bright spot detection (positive sentiment)
     # Try keyword matching first (fast)
@@ -263,8 +410,11 @@ def classify_article_section(
     # If positive keywords found or Gemini available, classify as bright spot
     sentiment = None
     if use_sentiment_api and GEMINI_AVAILABLE:
-        gemini_config = config.get('gemini', {})
-        sentiment = detect_sentiment(article, gemini_config)
+        # Reuse a sentiment from an earlier pass (e.g. summarization) before calling the API
+        sentiment = article.sentiment
+        if not sentiment:
+            gemini_config = config.get('gemini', {})
+            sentiment = article.sentiment = detect_sentiment(article, gemini_config)
         is_positive = sentiment == 'positive'
     else:
         is_positive = has_positive_keywords
@@ -305,15 +455,16 @@ def classify_all_articles(
         'grain_quality': []
     }
 
+    if use_sentiment_api and GEMINI_AVAILABLE:
+        _prefetch_sentiments(articles, config)
+
     for article in articles:
         section = classify_article_section(article, config, use_sentiment_api)
         article.section = section
 
-        # Detect sentiment for all articles (useful for balance checking)
-        if use_sentiment_api and GEMINI_AVAILABLE and not hasattr(article, 'sentiment'):
-            gemini_config = config.get('gemini', {})
-            article.sentiment = detect_sentiment(article, gemini_config)
-        elif not hasattr(article, 'sentiment'):
+        # Sentiment is set during classification or by the summary request,
+        # so no extra API call here (useful default for balance checking)
+        if not article.sentiment:
             article.sentiment = 'neutral'
 
         classified[section].append(article)
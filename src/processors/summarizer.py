@@ -9,22 +9,27 @@ import os
 import logging
 from typing import List
 import json
-import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import from parent
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from sources.rss_fetcher import Article
+from processors.response_parser import parse_json_response
+from processors.gemini_client import GEMINI_AVAILABLE, configure_gemini, get_model
 
 logger = logging.getLogger(__name__)
 
-# Try to import Gemini
+# Try to import the on-disk cache for AI results
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    from cache import ai_cache_key, get_cached_ai_result, cache_ai_result
+    CACHE_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
+    CACHE_AVAILABLE = False
+    logger.debug("Cache module not available")
+
+if not GEMINI_AVAILABLE:
     logger.warning("google-generativeai not installed. Run: pip install google-generativeai")
 
 
@@ -39,26 +44,13 @@ def init_gemini(api_key: str = None) -> bool:
         logger.error("GEMINI_API_KEY not set in environment")
         return False
 
-    genai.configure(api_key=key)
-    logger.debug("Gemini API configured successfully")
+    configure_gemini(key)
     return True
 
 
-def build_scott_voice_prompt(article: Article, section: str, config: dict, canadian_context: str = "") -> str:
-    """
-    Build a section-specific prompt in Scott's voice.
-
-    Args:
-        article: Article to summarize
-        section: Newsletter section (headline, bright_spot, tool, deep_dive, grain_quality)
-        config: Configuration dict
-        canadian_context: Pre-generated Canadian angle (optional)
-
-    Returns:
-        Formatted prompt string
-    """
-
-    base_instructions = """You are writing for Scott's "AI This Week" newsletter - a premium professional resource for Canadian AI professionals, executives, and policymakers.
+# Static persona/style block shared by every summary prompt (kept as one constant
+# prefix so it is built once and stays byte-identical across requests)
+_VOICE_INSTRUCTIONS = """You are writing for Scott's "AI This Week" newsletter - a premium professional resource for Canadian AI professionals, executives, and policymakers.
 
 VOICE & TONE (Non-Negotiable):
 - Professional but accessible: Not academic, not casual.
@@ -75,11 +67,11 @@ WRITING RULES:
 2. Use bullet points for lists to improve scannability.
 3. Every summary MUST connect to the Canadian context.
 
-CANADIAN FOCUS:""" + (f"\n{canadian_context}" if canadian_context else "")
+CANADIAN FOCUS:"""
 
-    # Section-specific formatting
-    section_formats = {
-        'headline': """
+# Section-specific formatting appended after the article details
+_SECTION_FORMATS = {
+    'headline': """
 Write 2-3 PARAGRAPHS covering:
 
 PARAGRAPH 1 (Who/What):
@@ -100,7 +92,7 @@ PARAGRAPH 3 (Canadian Angle - REQUIRED):
 
 CRITICAL: The summary MUST be 2-3 paragraphs with clear paragraph breaks (\\n\\n). Each paragraph should start with a specific focus as defined above.""",
 
-        'bright_spot': """
+    'bright_spot': """
 Write 2 PARAGRAPHS highlighting a positive breakthrough or innovation:
 
 PARAGRAPH 1: What happened and why it's impactful. Avoid hype; be analytical. (2-3 sentences)
@@ -108,7 +100,7 @@ PARAGRAPH 2: The broader benefit for society or innovation, with a focus on Cana
 
 Tone: Optimistic but grounded and nuanced.""",
 
-        'deep_dive': """
+    'deep_dive': """
 Write 3-4 PARAGRAPHS for a longer research or policy analysis:
 
 PARAGRAPH 1: Research question, methodology, or the core policy proposal. (2-3 sentences)
@@ -118,7 +110,7 @@ PARAGRAPH 4: Detailed Canadian relevance and "what to watch" in the coming month
 
 Each paragraph on its own line for clarity.""",
 
-        'tool': """
+    'tool': """
 Write 2 PARAGRAPHS focused on practical utility:
 
 PARAGRAPH 1: What the tool does, who it's for, and the specific problem it solves. (2-3 sentences)
@@ -126,14 +118,31 @@ PARAGRAPH 2: Potential use cases for Canadian professionals and practical utilit
 
 Focus on real utility, not marketing announcements.""",
 
-        'grain_quality': """
+    'grain_quality': """
 Write 2 PARAGRAPHS on application in agriculture/grain:
 
 PARAGRAPH 1: The specific AI application to grain quality or farming. (2-3 sentences)
 PARAGRAPH 2: Impact on Canadian agriculture and practical benefits for producers. (1-2 sentences)"""
-    }
+}
 
-    section_prompt = section_formats.get(section, section_formats['headline'])
+
+def build_scott_voice_prompt(article: Article, section: str, config: dict, canadian_context: str = "") -> str:
+    """
+    Build a section-specific prompt in Scott's voice.
+
+    Args:
+        article: Article to summarize
+        section: Newsletter section (headline, bright_spot, tool, deep_dive, grain_quality)
+        config: Configuration dict
+        canadian_context: Pre-generated Canadian angle (optional)
+
+    Returns:
+        Formatted prompt string
+    """
+
+    base_instructions = _VOICE_INSTRUCTIONS + (f"\n{canadian_context}" if canadian_context else "")
+
+    section_prompt = _SECTION_FORMATS.get(section, _SECTION_FORMATS['headline'])
 
     prompt = f"""{base_instructions}
 
@@ -173,7 +182,7 @@ def generate_canadian_context(article: Article, config: dict) -> str:
         return ""  # Already has Canadian content
 
     try:
-        genai.configure(api_key=api_key)
+        configure_gemini(api_key)
         model_name = config.get('gemini', {}).get('model', 'gemini-1.5-flash')
 
         prompt = f"""Generate a brief 1-2 sentence Canadian angle for this AI article.
@@ -186,7 +195,7 @@ Do NOT start with "For Canada," just provide the insight naturally.
 
 Respond with ONLY the Canadian angle text (no JSON, no markdown, just plain text)."""
 
-        model = genai.GenerativeModel(model_name)
+        model = get_model(model_name)
         response = model.generate_content(prompt)
 
         canadian_angle = response.text.strip()
@@ -227,6 +236,23 @@ def summarize_article(article: Article, config: dict, section: str = "headline")
 
     model_name = config.get('model', 'gemini-1.5-flash')
 
+    # Reuse an earlier result for the same article text, section and prompt
+    cache_key = None
+    if CACHE_AVAILABLE:
+        cache_key = ai_cache_key(
+            "summary", model_name, section, _VOICE_INSTRUCTIONS,
+            _SECTION_FORMATS.get(section, _SECTION_FORMATS['headline']),
+            article.title, article.source, article.category, article.summary
+        )
+        cached = get_cached_ai_result(cache_key)
+        if cached:
+            article.ai_summary = cached.get('summary', article.summary)
+            article.ai_commentary = cached.get('commentary', '')
+            article.sentiment = cached.get('sentiment', 'neutral')
+            article.canadian_context = cached.get('canadian_context', '')
+            logger.debug(f"Using cached summary for '{article.title[:50]}' ({section})")
+            return article
+
     # Generate Canadian context if needed
     canadian_context = generate_canadian_context(article, config)
 
@@ -234,26 +260,26 @@ def summarize_article(article: Article, config: dict, section: str = "headline")
     prompt = build_scott_voice_prompt(article, section, config, canadian_context)
 
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(model_name)
+        configure_gemini(api_key)
+        model = get_model(model_name)
         response = model.generate_content(prompt)
 
-        # Parse JSON response
-        response_text = response.text.strip()
-
-        # Handle markdown code blocks
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-
-        result = json.loads(response_text)
+        # Parse JSON response (tolerates markdown code blocks)
+        result = parse_json_response(response.text)
 
         article.ai_summary = result.get('summary', article.summary)
         article.ai_commentary = result.get('commentary', '')
         article.sentiment = result.get('sentiment', 'neutral')
         article.canadian_context = canadian_context
 
+        if cache_key:
+            cache_ai_result(cache_key, {
+                'summary': article.ai_summary,
+                'commentary': article.ai_commentary,
+                'sentiment': article.sentiment,
+                'canadian_context': canadian_context,
+            })
+
         logger.debug(f"Summarized '{article.title[:50]}' for section '{section}' (sentiment: {article.sentiment})")
 
     except json.JSONDecodeError as e:
@@ -271,64 +297,18 @@ def summarize_article(article: Article, config: dict, section: str = "headline")
     return article
 
 
-async def summarize_article_async(article: Article, config: dict, section: str = "headline") -> Article:
-    """
-    Async wrapper for article summarization.
-
-    Args:
-        article: Article to summarize
-        config: Gemini configuration
-        section: Newsletter section for section-specific prompts
-
-    Returns:
-        Article with AI summary
-    """
-    # Run the synchronous API call in a thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, summarize_article, article, config, section)
-
-
-async def summarize_articles_async(articles: List[Article], config: dict,
-                                   max_concurrent: int = 3) -> List[Article]:
-    """
-    Asynchronously generate AI summaries for a list of articles.
-    Uses concurrent requests with rate limiting to avoid API throttling.
-
-    Args:
-        articles: List of articles to summarize
-        config: Full configuration dictionary
-        max_concurrent: Maximum concurrent API requests (default 3 to avoid rate limits)
-
-    Returns:
-        List of articles with AI summaries
-    """
-    gemini_config = config.get('gemini', {})
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def summarize_with_semaphore(article: Article) -> Article:
-        """Summarize article with concurrency control."""
-        async with semaphore:
-            return await summarize_article_async(article, gemini_config)
-
-    logger.info(f"Starting parallel summarization for {len(articles)} articles (max {max_concurrent} concurrent)")
-    tasks = [summarize_with_semaphore(article) for article in articles]
-    summarized = await asyncio.gather(*tasks)
-    logger.info(f"Parallel summarization complete for {len(summarized)} articles")
-
-    return summarized
-
-
 def summarize_articles(articles: List[Article], config: dict,
                        progress_callback=None, parallel: bool = True) -> List[Article]:
     """
     Generate AI summaries for a list of articles.
-    Can use parallel async calls for better performance.
+    Can run the API calls in parallel for better performance.
 
     Args:
         articles: List of articles to summarize
         config: Full configuration dictionary
-        progress_callback: Optional callback function for progress updates
-        parallel: Use parallel async calls (default True)
+        progress_callback: Optional callback, called as progress_callback(completed, total)
+                           after each article is summarized
+        parallel: Summarize on a thread pool of gemini.max_concurrent workers (default True)
 
     Returns:
         List of articles with AI summaries
@@ -346,28 +326,12 @@ def summarize_articles(articles: List[Article], config: dict,
     # Try parallel if requested, fall back to sequential
     if parallel and len(articles) > 1:
         try:
-            # Check if there's already an event loop
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                # No running loop, create new one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    summarized = loop.run_until_complete(
-                        summarize_articles_async(articles, config)
-                    )
-                finally:
-                    loop.close()
-            else:
-                # Already have running loop, use sequential fallback
-                logger.debug("Event loop already running, using sequential summarization")
-                summarized = _summarize_articles_sequential(articles, gemini_config)
+            summarized = _summarize_articles_threaded(articles, gemini_config, progress_callback)
         except Exception as e:
             logger.warning(f"Parallel summarization failed, falling back to sequential: {e}")
-            summarized = _summarize_articles_sequential(articles, gemini_config)
+            summarized = _summarize_articles_sequential(articles, gemini_config, progress_callback)
     else:
-        summarized = _summarize_articles_sequential(articles, gemini_config)
+        summarized = _summarize_articles_sequential(articles, gemini_config, progress_callback)
 
     print("  ✓ Summarization complete")
     logger.info(f"Summarization complete for {len(summarized)} articles")
@@ -375,13 +339,41 @@ def summarize_articles(articles: List[Article], config: dict,
     return summarized
 
 
-def _summarize_articles_sequential(articles: List[Article], config: dict) -> List[Article]:
+def _summarize_articles_threaded(articles: List[Article], config: dict,
+                                 progress_callback=None) -> List[Article]:
+    """
+    Summarize articles on a thread pool bounded by gemini.max_concurrent.
+
+    Progress is reported as each article finishes; the result keeps the input order.
+    """
+    max_workers = min(config.get('max_concurrent', 3), len(articles))
+    logger.info(f"Summarizing {len(articles)} articles on {max_workers} threads")
+
+    summarized = [None] * len(articles)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(summarize_article, article, config): i
+            for i, article in enumerate(articles)
+        }
+        for completed, future in enumerate(as_completed(futures), 1):
+            summarized_article = future.result()
+            summarized[futures[future]] = summarized_article
+            print(f"  [{completed}/{len(articles)}] {summarized_article.title[:50]}...")
+            if progress_callback:
+                progress_callback(completed, len(articles))
+    return summarized
+
+
+def _summarize_articles_sequential(articles: List[Article], config: dict,
+                                   progress_callback=None) -> List[Article]:
     """Sequential fallback for article summarization."""
     summarized = []
     for i, article in enumerate(articles, 1):
         print(f"  [{i}/{len(articles)}] {article.title[:50]}...")
         summarized_article = summarize_article(article, config)
         summarized.append(summarized_article)
+        if progress_callback:
+            progress_callback(i, len(articles))
     return summarized
 
 
@@ -420,16 +412,10 @@ Respond in JSON:
 
     try:
         model_name = config.get('gemini', {}).get('model', 'models/gemini-2.0-flash')
-        model = genai.GenerativeModel(model_name)
+        model = get_model(model_name)
         response = model.generate_content(prompt)
         
-        response_text = response.text.strip()
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-                
-        return json.loads(response_text)
+        return parse_json_response(response.text)
         
     except Exception as e:
         logger.error(f"Deep dive suggestion error: {e}")
@@ -482,16 +468,10 @@ Respond in JSON:
 
     try:
         model_name = config.get('gemini', {}).get('model', 'models/gemini-2.0-flash')
-        model = genai.GenerativeModel(model_name)
+        model = get_model(model_name)
         response = model.generate_content(prompt)
         
-        response_text = response.text.strip()
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-        
-        result = json.loads(response_text)
+        result = parse_json_response(response.text)
         result['enabled'] = True
         return result
         
@@ -650,7 +630,7 @@ def generate_curated_report(raw_intel_path: Path = None, output_path: Path = Non
             try:
                 prompt = build_scott_voice_prompt(article, prompt_section, config)
                 model_name = config.get('gemini', {}).get('model', 'models/gemini-2.0-flash')
-                model = genai.GenerativeModel(model_name)
+                model = get_model(model_name)
                 response = model.generate_content(prompt)
                 
                 ai_summary = response.text.strip() if response.text else item.get('summary', '')
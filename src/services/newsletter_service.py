@@ -12,13 +12,13 @@ import os
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
 from sources.rss_fetcher import Article
 from processors.summarizer import summarize_articles, summarize_article, generate_theme_of_week
 from processors.section_classifier import classify_all_articles
 from processors.article_selector import auto_select_articles
-from formatters.email_formatter import format_newsletter_html, format_newsletter_html_sections
+from formatters.email_formatter import format_newsletter_html, format_newsletter_html_sections, save_newsletter
 
 logger = logging.getLogger(__name__)
 
@@ -110,12 +110,12 @@ class NewsletterService:
             logger.error(f"Error generating newsletter HTML: {e}")
             raise
 
-    def save_newsletter(self, html_content: str, date: Optional[str] = None) -> Path:
+    def save_newsletter(self, html_content: Union[str, bytes], date: Optional[str] = None) -> Path:
         """
         Save newsletter HTML to file.
 
         Args:
-            html_content: HTML content to save
+            html_content: HTML content to save (text or UTF-8 bytes)
             date: Date string in YYYY-MM-DD format (default: today)
 
         Returns:
@@ -125,10 +125,7 @@ class NewsletterService:
             date = datetime.now().strftime('%Y-%m-%d')
 
         try:
-            output_file = self.output_dir / f"newsletter_{date}.html"
-
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            output_file = save_newsletter(html_content, self.output_dir, f"newsletter_{date}.html")
 
             logger.info(f"Newsletter saved to {output_file}")
             return output_file
@@ -7,6 +7,7 @@ Fetches articles from Google Alerts and other RSS feeds.
 
 import feedparser
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import List, Optional
@@ -25,9 +26,9 @@ except ImportError:
     logger.debug("Cache module not available")
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
-    """Represents a fetched article."""
+    """Represents a fetched article (slotted: fixed fields, no per-instance __dict__)."""
     title: str
     url: str
     source: str
@@ -110,6 +111,26 @@ def clean_html(text: str) -> str:
     return clean.strip()
 
 
+# Feeds downloaded concurrently; feedparser blocks on network I/O, so threads overlap it
+FETCH_WORKERS = 10
+
+
+def _parse_feed(url: str):
+    """Download and parse one feed, returning (feed, error)."""
+    try:
+        return feedparser.parse(url), None
+    except Exception as e:
+        return None, e
+
+
+def _parse_feeds(urls: List[str]) -> list:
+    """Download and parse feeds in parallel, returning (feed, error) pairs in input order."""
+    if len(urls) <= 1:
+        return [_parse_feed(url) for url in urls]
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as executor:
+        return list(executor.map(_parse_feed, urls))
+
+
 def fetch_google_alerts(alerts_config: List[dict], max_age_days: int = 7) -> List[Article]:
     """
     Fetch articles from Google Alerts RSS feeds.
@@ -123,20 +144,26 @@ def fetch_google_alerts(alerts_config: List[dict], max_age_days: int = 7) -> Lis
     """
     articles = []
     cutoff_date = datetime.now() - timedelta(days=max_age_days)
-    
+
+    alerts = []
     for alert in alerts_config:
-        url = alert.get('url', '')
-        if not url:
+        if not alert.get('url', ''):
             logger.warning(f"Skipping '{alert.get('name', 'Unknown')}' - no URL configured")
             print(f"  ⚠️  Skipping '{alert.get('name', 'Unknown')}' - no URL configured")
             continue
+        alerts.append(alert)
+
+    results = _parse_feeds([alert['url'] for alert in alerts])
 
+    for alert, (feed, error) in zip(alerts, results):
+        url = alert['url']
         alert_name = alert.get('name', url[:50])
-        print(f"  📡 Fetching: {alert_name}")
-        logger.debug(f"Fetching Google Alert: {alert_name}")
+        print(f"  📡 Fetched: {alert_name}")
+        logger.debug(f"Fetched Google Alert: {alert_name}")
 
         try:
-            feed = feedparser.parse(url)
+            if error:
+                raise error
 
             if feed.bozo and not feed.entries:
                 logger.warning(f"Error parsing feed {alert_name}: {feed.bozo_exception}")
@@ -183,19 +210,25 @@ def fetch_rss_feeds(feeds_config: List[dict], max_age_days: int = 7) -> List[Art
     """
     articles = []
     cutoff_date = datetime.now() - timedelta(days=max_age_days)
-    
+
+    feeds = []
     for feed_config in feeds_config:
-        url = feed_config.get('url', '')
-        if not url:
+        if not feed_config.get('url', ''):
             logger.warning(f"RSS feed config missing URL: {feed_config.get('name', 'Unknown')}")
             continue
+        feeds.append(feed_config)
+
+    results = _parse_feeds([feed_config['url'] for feed_config in feeds])
 
+    for feed_config, (feed, error) in zip(feeds, results):
+        url = feed_config['url']
         feed_name = feed_config.get('name', url[:50])
-        print(f"  📡 Fetching: {feed_name}")
-        logger.debug(f"Fetching RSS feed: {feed_name}")
+        print(f"  📡 Fetched: {feed_name}")
+        logger.debug(f"Fetched RSS feed: {feed_name}")
 
         try:
-            feed = feedparser.parse(url)
+            if error:
+                raise error
 
             if feed.bozo and not feed.entries:
                 logger.warning(f"Error parsing RSS feed {feed_name}: {feed.bozo_exception}")
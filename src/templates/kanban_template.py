@@ -542,6 +542,28 @@ KANBAN_TEMPLATE = '''
         </div>
     </header>
     
+    {% set initial_cards = 40 %}
+    {% macro article_card(article) %}
+        <div class="article-card {% if article._is_canadian %}canadian{% endif %}" 
+             draggable="true" 
+             ondragstart="dragStart(event)" 
+             id="card-{{ article._index }}"
+             data-index="{{ article._index }}"
+             data-title="{{ article.title }}"
+             data-source="{{ article.source }}">
+            <div class="card-title">
+                <a href="{{ article.link }}" target="_blank">{{ article.title[:75] }}{% if article.title|length > 75 %}...{% endif %}</a>
+            </div>
+            <div class="card-meta">
+                <span class="card-source">{{ article.source[:25] }}</span>
+                <div class="card-badges">
+                    {% if article._is_canadian %}<span class="badge badge-canadian">CA</span>{% endif %}
+                    <span class="badge badge-score-low" id="score-{{ article._index }}"></span>
+                </div>
+            </div>
+        </div>
+    {% endmacro %}
+    
     <div class="kanban-container">
         <!-- Unsorted Articles Column -->
         <div class="kanban-column column-unsorted">
@@ -550,27 +572,17 @@ KANBAN_TEMPLATE = '''
                 <span class="column-count" id="unsorted-count">{{ articles|length }}</span>
             </div>
             <div class="column-content" id="unsorted-column" ondrop="dropArticle(event, 'unsorted')" ondragover="allowDrop(event)" ondragleave="dragLeave(event)">
-                {% for article in articles %}
-                <div class="article-card {% if article._is_canadian %}canadian{% endif %}" 
-                     draggable="true" 
-                     ondragstart="dragStart(event)" 
-                     id="card-{{ article._index }}"
-                     data-index="{{ article._index }}"
-                     data-title="{{ article.title }}"
-                     data-source="{{ article.source }}">
-                    <div class="card-title">
-                        <a href="{{ article.link }}" target="_blank">{{ article.title[:75] }}{% if article.title|length > 75 %}...{% endif %}</a>
-                    </div>
-                    <div class="card-meta">
-                        <span class="card-source">{{ article.source[:25] }}</span>
-                        <div class="card-badges">
-                            {% if article._is_canadian %}<span class="badge badge-canadian">CA</span>{% endif %}
-                            <span class="badge badge-score-low" id="score-{{ article._index }}"></span>
-                        </div>
-                    </div>
-                </div>
+                {% for article in articles[:initial_cards] %}
+                {{ article_card(article) }}
                 {% endfor %}
+                <div id="load-more"></div>
             </div>
+            <!-- Off-screen cards, moved into the Inbox in batches as it scrolls -->
+            <template id="deferred-cards">
+                {% for article in articles[initial_cards:] %}
+                {{ article_card(article) }}
+                {% endfor %}
+            </template>
         </div>
         
         <!-- Section Columns -->
@@ -612,6 +624,35 @@ KANBAN_TEMPLATE = '''
         
         let draggedCard = null;
         
+        // Lazy card rendering: cards past the first batch live in an inert
+        // <template> and are moved into the Inbox as the sentinel scrolls into view
+        const CARD_BATCH = 40;
+        const deferredCards = document.getElementById('deferred-cards');
+        const loadMoreSentinel = document.getElementById('load-more');
+        
+        function renderMoreCards(count) {
+            const column = document.getElementById('unsorted-column');
+            const pending = deferredCards.content.children;
+            for (let i = 0; i < count && pending.length; i++) {
+                column.insertBefore(pending[0], loadMoreSentinel);
+            }
+        }
+        
+        function findCardElement(id) {
+            return document.getElementById(id) || deferredCards.content.getElementById(id);
+        }
+        
+        function isUnsorted(card) {
+            // Deferred cards have no parent element yet
+            return !card.parentElement || card.parentElement.id === 'unsorted-column';
+        }
+        
+        new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                renderMoreCards(CARD_BATCH);
+            }
+        }, {root: document.getElementById('unsorted-column'), rootMargin: '200px'}).observe(loadMoreSentinel);
+        
         function dragStart(e) {
             draggedCard = e.target;
             e.target.classList.add('dragging');
@@ -646,9 +687,11 @@ KANBAN_TEMPLATE = '''
             
             if (sectionId !== 'unsorted') {
                 assignments[sectionId].push(articleIndex);
+                e.currentTarget.appendChild(card);
+            } else {
+                e.currentTarget.insertBefore(card, loadMoreSentinel);
             }
             
-            e.currentTarget.appendChild(card);
             card.classList.remove('dragging');
             
             updateColumnCount(sectionId);
@@ -664,11 +707,16 @@ KANBAN_TEMPLATE = '''
         
         function updateUnsortedCount() {
             const unsortedCol = document.getElementById('unsorted-column');
-            document.getElementById('unsorted-count').textContent = unsortedCol.children.length;
+            const rendered = unsortedCol.querySelectorAll('.article-card').length;
+            document.getElementById('unsorted-count').textContent = rendered + deferredCards.content.children.length;
         }
         
         function filterArticles() {
             const query = document.getElementById('search-input').value.toLowerCase();
+            if (query) {
+                // Searching needs every card in the DOM
+                renderMoreCards(Infinity);
+            }
             document.querySelectorAll('.article-card').forEach(card => {
                 const title = card.dataset.title.toLowerCase();
                 const source = card.dataset.source.toLowerCase();
@@ -722,7 +770,7 @@ KANBAN_TEMPLATE = '''
         
         function displayScores() {
             Object.entries(articleScores).forEach(([idx, data]) => {
-                const badge = document.getElementById('score-' + idx);
+                const badge = findCardElement('score-' + idx);
                 if (badge && data.score) {
                     badge.textContent = data.score;
                     badge.className = 'badge ' + (data.score >= 7 ? 'badge-score-high' : data.score >= 4 ? 'badge-score-med' : 'badge-score-low');
@@ -761,8 +809,8 @@ KANBAN_TEMPLATE = '''
                 const limit = sectionLimits[section] || 2;
                 
                 if (sectionCounts[section] < limit) {
-                    const card = document.getElementById('card-' + item.idx);
-                    if (card && card.parentElement.id === 'unsorted-column') {
+                    const card = findCardElement('card-' + item.idx);
+                    if (card && isUnsorted(card)) {
                         assignments[section].push(item.idx);
                         document.getElementById('section-' + section).appendChild(card);
                         sectionCounts[section]++;
@@ -819,12 +867,28 @@ KANBAN_TEMPLATE = '''
             .then(r => r.json())
             .then(data => {
                 if (data.success) {
+                    showStatus('Generating newsletter...');
+                    pollGenerateStatus(data.job_id);
+                } else {
+                    alert('Error: ' + data.error);
+                }
+            });
+        }
+        
+        function pollGenerateStatus(jobId) {
+            fetch('/generate/status/' + jobId)
+            .then(r => r.json())
+            .then(data => {
+                if (data.status === 'pending') {
+                    setTimeout(() => pollGenerateStatus(jobId), 500);
+                } else if (data.success) {
                     showStatus('✓ Newsletter generated');
                     setTimeout(() => {
                         hideStatus();
                         window.open('/preview', '_blank');
                     }, 1000);
                 } else {
+                    hideStatus();
                     alert('Error: ' + data.error);
                 }
             });
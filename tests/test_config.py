@@ -172,6 +172,23 @@ class TestConfigLoader(unittest.TestCase):
         finally:
             Path(temp_path).unlink()
 
+    def test_cached_config_is_copied_and_reloaded(self):
+        """Test that cached configs are isolated per caller and refresh on edit."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump({'newsletter': {'name': 'First'}}, f)
+            temp_path = f.name
+
+        try:
+            config = load_config(temp_path)
+            config['newsletter']['name'] = 'Mutated'
+            self.assertEqual(load_config(temp_path)['newsletter']['name'], 'First')
+
+            with open(temp_path, 'w') as f:
+                yaml.dump({'newsletter': {'name': 'Second, edited'}}, f)
+            self.assertEqual(load_config(temp_path)['newsletter']['name'], 'Second, edited')
+        finally:
+            Path(temp_path).unlink()
+
 
 class TestConfigModel(unittest.TestCase):
     """Test Pydantic config models."""
@@ -0,0 +1,27 @@
+"""Unit tests for the curator app's pre-scoring."""
+
+import unittest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add repo root to path (curator_app imports through the src package)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.curator_app import prescore_article
+
+
+class TestPrescoreArticle(unittest.TestCase):
+    """Test the keyword/recency prior used before Gemini scoring."""
+
+    def test_recency_applies_to_offset_timestamps(self):
+        """Test that a fresh article with a UTC offset outranks a week-old one."""
+        now = datetime(2025, 1, 1, 12, 0)
+        fresh = {'title': 'Update', 'published': '2025-01-01T10:00:00+00:00'}
+        week_old = {'title': 'Update', 'published': '2024-12-25T10:00:00+00:00'}
+
+        self.assertGreater(prescore_article(fresh, now), prescore_article(week_old, now))
+
+
+if __name__ == '__main__':
+    unittest.main()
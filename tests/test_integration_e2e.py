@@ -336,6 +336,20 @@ class TestE2ENewsletter(unittest.TestCase):
         # Cleanup
         newsletter_path.unlink()
 
+    def test_failed_render_leaves_no_temp_file(self):
+        """Test that a render error mid-stream removes the partial temp file."""
+        output_dir = Path(__file__).parent / "output"
+
+        def failing_chunks():
+            yield "<html><body>"
+            raise AttributeError("broken article")
+
+        with self.assertRaises(AttributeError):
+            save_newsletter(failing_chunks(), output_dir, "failed_newsletter.html")
+
+        self.assertFalse((output_dir / "failed_newsletter.html.tmp").exists(), "Temp file left behind")
+        self.assertFalse((output_dir / "failed_newsletter.html").exists(), "Partial newsletter saved")
+
     def test_article_classification_accuracy(self):
         """Test that articles are classified into appropriate sections."""
         articles = self.create_sample_articles()
@@ -0,0 +1,55 @@
+"""Unit tests for logging configuration."""
+
+import logging
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import logger as logger_module
+from logger import setup_logger
+
+
+class TestSetupLogger(unittest.TestCase):
+    """Test setup_logger handler management."""
+
+    def test_force_flushes_buffered_file_records(self):
+        """Test that rebuilding handlers writes out records still buffered for the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "bot.log"
+            logger = setup_logger("test_force_flush", log_file=log_file)
+            logger.info("buffered line")
+
+            setup_logger("test_force_flush", force=True)
+
+            self.assertIn("buffered line", log_file.read_text(encoding='utf-8'))
+
+    def test_force_rebuild_tracks_only_live_buffer(self):
+        """Test that rebuilding with a log file doesn't keep old buffers for the exit flush."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "bot.log"
+            logger = setup_logger("test_force_buffers", log_file=log_file)
+            setup_logger("test_force_buffers", log_file=log_file, force=True)
+
+            tracked = [h for h in logger_module._buffered_handlers if h in logger.handlers]
+            self.assertEqual(len(tracked), 1)
+            self.assertEqual(
+                sum(1 for h in logger_module._buffered_handlers if h.target is None), 0,
+                "Closed handlers should not be flushed at exit"
+            )
+            setup_logger("test_force_buffers", force=True)
+
+    def test_repeat_call_applies_level(self):
+        """Test that a repeat call without force still changes the level."""
+        logger = setup_logger("test_repeat_level", level="INFO")
+        setup_logger("test_repeat_level", level="DEBUG")
+
+        self.assertEqual(logger.level, logging.DEBUG)
+        self.assertTrue(all(h.level == logging.DEBUG for h in logger.handlers))
+
+
+if __name__ == '__main__':
+    unittest.main()
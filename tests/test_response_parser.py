@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Gemini response parsing.
+"""
+
+import json
+import unittest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from processors.response_parser import parse_json_response
+
+
+class TestParseJsonResponse(unittest.TestCase):
+    """Test extracting JSON objects from model responses"""
+
+    def test_plain_json(self):
+        """Test bare JSON object"""
+        self.assertEqual(parse_json_response('{"score": 7}'), {"score": 7})
+
+    def test_fenced_json(self):
+        """Test JSON wrapped in a markdown code block"""
+        text = '```json\n{"score": 7, "reason": "useful"}\n```'
+        self.assertEqual(parse_json_response(text), {"score": 7, "reason": "useful"})
+
+    def test_surrounding_prose(self):
+        """Test prose before and after the object is ignored"""
+        text = 'Here is the result:\n{"title": "AI"}\nLet me know if you need more.'
+        self.assertEqual(parse_json_response(text), {"title": "AI"})
+
+    def test_fence_inside_string(self):
+        """Test backticks inside a string value do not truncate the object"""
+        text = '```json\n{"summary": "Use ```code``` blocks"}\n```'
+        self.assertEqual(parse_json_response(text), {"summary": "Use ```code``` blocks"})
+
+    def test_no_object_raises(self):
+        """Test responses without JSON raise JSONDecodeError"""
+        with self.assertRaises(json.JSONDecodeError):
+            parse_json_response("Sorry, I can't help with that.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -76,6 +76,12 @@ class TestScoringFunctions(unittest.TestCase):
         score = calculate_topic_score(article, self.config)
         self.assertEqual(score, 0, "Article without keywords should have zero topic score")
 
+    def test_topic_score_accepts_loaded_topic_list(self):
+        """Test that the list format produced by load_config is scored."""
+        score, category = calculate_topic_score(self.article_recent, self.config['topics'])
+        self.assertEqual(score, 4.0, "Two AGI keyword matches at priority 2.0")
+        self.assertEqual(category, 'capabilities')
+
     def test_recency_score_recent_article(self):
         """Test that recent articles get higher recency scores."""
         score_recent = calculate_recency_score(self.article_recent, days_old=0)
@@ -25,8 +25,10 @@ from processors.section_classifier import (
     has_tool_keywords,
     is_research_paper,
     is_long_form,
-    has_grain_keywords
+    has_grain_keywords,
+    _parse_batch_sentiments
 )
+from processors.response_parser import parse_json_response
 from processors.article_selector import (
     is_canadian_government_story,
     is_governance_story,
@@ -126,6 +128,12 @@ class TestSectionClassifier(unittest.TestCase):
         assert is_canadian_government_story(self.canadian_gov_article)
         assert not is_canadian_government_story(self.governance_article)
 
+    def test_batch_sentiment_string_ids(self):
+        """Test that batch sentiment responses with string ids map to article numbers."""
+        response = '{"sentiments": [{"id": "1", "sentiment": "positive"}, {"id": "2", "sentiment": "NEGATIVE"}]}'
+        by_id = _parse_batch_sentiments(parse_json_response(response))
+        assert by_id == {1: "positive", 2: "negative"}
+
     def test_classify_positive_article(self):
         """Test classification of positive sentiment article."""
         # Use keyword-based sentiment (no API call)
@@ -333,6 +341,21 @@ class TestHTMLFormatting(unittest.TestCase):
         assert "Paragraph 2." in html
         assert "  " not in html.split(">")[1]  # No spaces after tags
 
+    def test_format_paragraphs_blank_line_with_spaces(self):
+        """Test that blank lines containing whitespace still separate paragraphs."""
+        text = "Paragraph 1.\n  \n\nParagraph 2."
+        html = format_paragraphs(text)
+
+        assert html.count("<p") == 2
+
+    def test_format_paragraphs_escapes_html(self):
+        """Test that paragraph text is HTML-escaped."""
+        text = "Tools & <script>alert(1)</script>"
+        html = format_paragraphs(text)
+
+        assert "<script>" not in html
+        assert "Tools &amp; &lt;script&gt;" in html
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests combining multiple components."""